@@ -1,10 +1,17 @@
 #[cfg(feature = "embeddings")]
 mod inner {
-    use std::sync::OnceLock;
+    use std::collections::{HashMap, VecDeque};
+    use std::sync::{Mutex, OnceLock};
 
     use fastembed::{EmbeddingModel, InitOptions, TextEmbedding};
 
     static MODEL: OnceLock<TextEmbedding> = OnceLock::new();
+    static CACHE: OnceLock<Mutex<EmbedCache>> = OnceLock::new();
+
+    /// Entries kept in the query-embedding cache (~1.5 KB each at 384 dims).
+    const CACHE_CAPACITY: usize = 128;
+    /// Longer texts are stored memories, not repeated queries: don't cache them.
+    const CACHE_MAX_TEXT_LEN: usize = 512;
 
     fn get_model() -> &'static TextEmbedding {
         MODEL.get_or_init(|| {
@@ -15,16 +22,102 @@ mod inner {
         })
     }
 
+    /// Small LRU of recent text -> vector results, so a repeated search
+    /// (dashboard refresh, an agent re-running the same query) skips the model.
+    struct EmbedCache {
+        map: HashMap<String, Vec<f32>>,
+        order: VecDeque<String>,
+        capacity: usize,
+    }
+
+    impl EmbedCache {
+        fn new(capacity: usize) -> Self {
+            Self {
+                map: HashMap::with_capacity(capacity),
+                order: VecDeque::with_capacity(capacity),
+                capacity,
+            }
+        }
+
+        fn get(&mut self, text: &str) -> Option<Vec<f32>> {
+            let vec = self.map.get(text)?.clone();
+            if let Some(pos) = self.order.iter().position(|k| k == text) {
+                let key = self.order.remove(pos).unwrap();
+                self.order.push_back(key);
+            }
+            Some(vec)
+        }
+
+        fn put(&mut self, text: &str, vec: &[f32]) {
+            if let Some(cached) = self.map.get_mut(text) {
+                // Refresh the value and count the write as a use
+                *cached = vec.to_vec();
+                if let Some(pos) = self.order.iter().position(|k| k == text) {
+                    let key = self.order.remove(pos).unwrap();
+                    self.order.push_back(key);
+                }
+                return;
+            }
+            if self.order.len() >= self.capacity {
+                if let Some(oldest) = self.order.pop_front() {
+                    self.map.remove(&oldest);
+                }
+            }
+            self.order.push_back(text.to_string());
+            self.map.insert(text.to_string(), vec.to_vec());
+        }
+    }
+
+    fn cache() -> &'static Mutex<EmbedCache> {
+        CACHE.get_or_init(|| Mutex::new(EmbedCache::new(CACHE_CAPACITY)))
+    }
+
     pub fn embed_text(text: &str) -> Vec<f32> {
+        let cacheable = text.len() <= CACHE_MAX_TEXT_LEN;
+        if cacheable {
+            if let Some(vec) = cache().lock().unwrap().get(text) {
+                return vec;
+            }
+        }
         let model = get_model();
         let results = model.embed(vec![text], None).expect("embedding failed");
-        results.into_iter().next().unwrap()
+        let vec = results.into_iter().next().unwrap();
+        if cacheable {
+            cache().lock().unwrap().put(text, &vec);
+        }
+        vec
     }
 
     pub fn embed_batch(texts: &[&str]) -> Vec<Vec<f32>> {
         let model = get_model();
         model.embed(texts.to_vec(), None).expect("embedding failed")
     }
+
+    #[cfg(test)]
+    mod tests {
+        use super::*;
+
+        #[test]
+        fn test_embed_cache_evicts_least_recent() {
+            let mut cache = EmbedCache::new(2);
+            cache.put("a", &[1.0]);
+            cache.put("b", &[2.0]);
+            // Touch "a" so "b" becomes the eviction candidate
+            assert_eq!(cache.get("a"), Some(vec![1.0]));
+            cache.put("c", &[3.0]);
+            assert_eq!(cache.get("b"), None);
+            assert_eq!(cache.get("a"), Some(vec![1.0]));
+            assert_eq!(cache.get("c"), Some(vec![3.0]));
+
+            // Re-putting "a" replaces its value and makes it most recent,
+            // so "c" is evicted next
+            cache.put("a", &[4.0]);
+            cache.put("d", &[5.0]);
+            assert_eq!(cache.get("c"), None);
+            assert_eq!(cache.get("a"), Some(vec![4.0]));
+            assert_eq!(cache.get("d"), Some(vec![5.0]));
+        }
+    }
 }
 
 #[cfg(feature = "embeddings")]
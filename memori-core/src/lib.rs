@@ -80,7 +80,8 @@ impl Memori {
         merge_metadata: bool,
     ) -> Result<()> {
         let full_id = storage::resolve_prefix(&self.conn, id)?;
-        storage::update(&self.conn, &full_id, content, vector, metadata, merge_metadata)
+        storage::update(&self.conn, &full_id, content, vector, metadata, merge_metadata)?;
+        Ok(())
     }
 
     pub fn delete(&self, id: &str) -> Result<()> {
@@ -96,6 +97,16 @@ impl Memori {
         storage::count(&self.conn)
     }
 
+    /// Count memories matching list-style filters (type, before, after).
+    pub fn count_filtered(
+        &self,
+        type_filter: Option<&str>,
+        before: Option<f64>,
+        after: Option<f64>,
+    ) -> Result<usize> {
+        storage::count_filtered(&self.conn, type_filter, before, after)
+    }
+
     pub fn type_distribution(&self) -> Result<HashMap<String, usize>> {
         storage::type_distribution(&self.conn)
     }
@@ -108,11 +119,47 @@ impl Memori {
         storage::delete_by_type(&self.conn, type_value)
     }
 
+    /// Delete memories matching every given filter (AND), in one statement.
+    pub fn delete_filtered(
+        &self,
+        type_filter: Option<&str>,
+        before: Option<f64>,
+        after: Option<f64>,
+    ) -> Result<usize> {
+        storage::delete_filtered(&self.conn, type_filter, before, after)
+    }
+
     pub fn touch(&self, id: &str) -> Result<()> {
         let full_id = storage::resolve_prefix(&self.conn, id)?;
         storage::touch(&self.conn, &full_id)
     }
 
+    /// Group the following writes into one transaction until `commit`/`rollback`.
+    pub fn begin(&self) -> Result<()> {
+        storage::begin(&self.conn)
+    }
+
+    pub fn commit(&self) -> Result<()> {
+        storage::commit(&self.conn)
+    }
+
+    pub fn rollback(&self) -> Result<()> {
+        storage::rollback(&self.conn)
+    }
+
+    /// Savepoint within a `begin()` transaction: undo one unit of work on failure.
+    pub fn savepoint(&self) -> Result<()> {
+        storage::savepoint(&self.conn)
+    }
+
+    pub fn release_savepoint(&self) -> Result<()> {
+        storage::release_savepoint(&self.conn)
+    }
+
+    pub fn rollback_to_savepoint(&self) -> Result<()> {
+        storage::rollback_to_savepoint(&self.conn)
+    }
+
     pub fn vacuum(&self) -> Result<()> {
         storage::vacuum(&self.conn)
     }
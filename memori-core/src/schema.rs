@@ -1,10 +1,15 @@
 use rusqlite::Connection;
 
 pub fn init_db(conn: &Connection) -> rusqlite::Result<()> {
-  // Base table and WAL mode (always idempotent)
+  // Base table and WAL mode (always idempotent).
+  // synchronous=NORMAL is durable under WAL except on power loss, and skips
+  // the fsync on every commit. The page cache is a cap, allocated lazily.
   conn.execute_batch(
     "
     PRAGMA journal_mode=WAL;
+    PRAGMA synchronous=NORMAL;
+    PRAGMA temp_store=MEMORY;
+    PRAGMA cache_size=-65536;
 
     CREATE TABLE IF NOT EXISTS memories (
         id          TEXT PRIMARY KEY,
@@ -93,5 +98,58 @@ pub fn init_db(conn: &Connection) -> rusqlite::Result<()> {
     )?;
   }
 
+  // Re-read version after potential v2->v3 migration
+  let version: i32 = conn.pragma_query_value(None, "user_version", |r| r.get(0))?;
+
+  if version < 4 {
+    // Composite (type, created_at) index: type-filtered lists, purge
+    // previews and counts sorted or bounded by creation time become a single
+    // index range scan with no temp B-tree sort. Its leading column serves
+    // every query the v3 single-column index did, so that one is dropped.
+    conn.execute_batch(
+      "
+      CREATE INDEX IF NOT EXISTS idx_memories_type_created
+          ON memories(json_extract(metadata, '$.type'), created_at);
+      DROP INDEX IF EXISTS idx_memories_type;
+      PRAGMA user_version = 4;
+      ",
+    )?;
+  }
+
+  // Re-read version after potential v3->v4 migration
+  let version: i32 = conn.pragma_query_value(None, "user_version", |r| r.get(0))?;
+
+  if version < 5 {
+    // Timestamp indexes: `list` (default sort=created), `context` recents
+    // (sort=updated) and date-bounded purges read the first N rows of an
+    // index instead of scanning the table into a temp B-tree sort.
+    // last_accessed/access_count are left unindexed: every get() rewrites
+    // them, so an index there would tax the read path.
+    conn.execute_batch(
+      "
+      CREATE INDEX IF NOT EXISTS idx_memories_created ON memories(created_at);
+      CREATE INDEX IF NOT EXISTS idx_memories_updated ON memories(updated_at);
+      PRAGMA user_version = 5;
+      ",
+    )?;
+  }
+
+  // Re-read version after potential v4->v5 migration
+  let version: i32 = conn.pragma_query_value(None, "user_version", |r| r.get(0))?;
+
+  if version < 6 {
+    // Partial index over ids that are not canonical lower-case UUID text
+    // (imported ids in other cases or formats). It is empty for generated
+    // ids, so prefix resolution can check for such ids with one seek and
+    // trust its case-sensitive primary-key range when there are none.
+    conn.execute_batch(
+      "
+      CREATE INDEX IF NOT EXISTS idx_memories_noncanonical_id
+          ON memories(id) WHERE id GLOB '*[^0-9a-f-]*';
+      PRAGMA user_version = 6;
+      ",
+    )?;
+  }
+
   Ok(())
 }
@@ -1,21 +1,14 @@
 use rusqlite::params;
 use serde_json::Value;
+use std::collections::hash_map::Entry;
 use std::collections::HashMap;
-use std::time::{SystemTime, UNIX_EPOCH};
 
 use crate::storage::{get_raw, row_to_memory};
 use crate::types::{Memory, MemoriError, Result, SearchQuery};
-use crate::util::{blob_to_vec, cosine_similarity};
+use crate::util::{blob_to_vec, cosine_similarity, now_secs};
 
 const RRF_K: f32 = 60.0;
 
-fn now_secs() -> f64 {
-    SystemTime::now()
-        .duration_since(UNIX_EPOCH)
-        .unwrap()
-        .as_secs_f64()
-}
-
 pub fn search(conn: &rusqlite::Connection, query: SearchQuery) -> Result<Vec<Memory>> {
     let now = now_secs();
 
@@ -51,7 +44,9 @@ pub fn search(conn: &rusqlite::Connection, query: SearchQuery) -> Result<Vec<Mem
         (None, Some(text)) => {
             #[cfg(feature = "embeddings")]
             {
-                if query.text_only {
+                // Blank text has no FTS5 tokens; skip the embedding model rather
+                // than ranking every memory against the vector of "".
+                if query.text_only || text.trim().is_empty() {
                     text_search(conn, text, combined_filter.as_deref(), query.limit, now)?
                 } else {
                     let query_vec = crate::embed::embed_text(text);
@@ -93,47 +88,67 @@ fn vector_search(
     limit: usize,
     now: f64,
 ) -> Result<Vec<Memory>> {
-    let where_clause = filter.map_or(String::new(), |f| format!("WHERE {}", f));
+    // Score from the columns the ranking needs, then load full rows for the
+    // top `limit` only: content and metadata of the losers are never read.
+    let where_clause = filter.map_or(String::from("WHERE vector IS NOT NULL"), |f| {
+        format!("WHERE vector IS NOT NULL AND ({})", f)
+    });
     let sql = format!(
-        "SELECT id, content, vector, metadata, created_at, updated_at, last_accessed, access_count
+        "SELECT rowid, vector, last_accessed, access_count
          FROM memories {} ORDER BY rowid",
         where_clause
     );
 
     let mut stmt = conn.prepare(&sql)?;
-    let mut scored: Vec<(Memory, f32)> = Vec::new();
+    let mut scored: Vec<(i64, f32)> = Vec::new();
     let mut rows = stmt.query([])?;
 
     while let Some(row) = rows.next()? {
-        let mem = row_to_memory(row)?;
-        if let Some(ref vec) = mem.vector {
-            let sim = cosine_similarity(query_vec, vec);
-            let boosted = apply_access_boost(sim, mem.access_count, mem.last_accessed, now);
-            scored.push((mem, boosted));
-        }
+        let rowid: i64 = row.get(0)?;
+        let blob: Vec<u8> = row.get(1)?;
+        let last_accessed: f64 = row.get(2)?;
+        let access_count: i64 = row.get(3)?;
+        let sim = cosine_similarity(query_vec, &blob_to_vec(&blob));
+        let boosted = apply_access_boost(sim, access_count, last_accessed, now);
+        scored.push((rowid, boosted));
     }
 
     scored.sort_by(|a, b| b.1.partial_cmp(&a.1).unwrap_or(std::cmp::Ordering::Equal));
     scored.truncate(limit);
 
-    Ok(scored
-        .into_iter()
-        .map(|(mut m, s)| {
-            m.score = Some(s);
-            m
-        })
-        .collect())
+    let mut fetch = conn.prepare_cached(
+        "SELECT id, content, vector, metadata, created_at, updated_at, last_accessed, access_count
+         FROM memories WHERE rowid = ?1",
+    )?;
+    let mut results = Vec::with_capacity(scored.len());
+    for (rowid, score) in scored {
+        let mut mem = fetch.query_row(params![rowid], row_to_memory)?;
+        mem.score = Some(score);
+        results.push(mem);
+    }
+    Ok(results)
 }
 
 /// Sanitize user input for FTS5 MATCH queries. FTS5 has its own query syntax
 /// where `-` means NOT, `:` means column filter, `*` means prefix, etc.
 /// Wrapping each token in double quotes forces literal matching.
 fn sanitize_fts_query(query: &str) -> String {
-    query
-        .split_whitespace()
-        .map(|term| format!("\"{}\"", term.replace('"', "\"\"")))
-        .collect::<Vec<_>>()
-        .join(" ")
+    // Single pass into one buffer: no per-term String, Vec, or join.
+    let mut out = String::with_capacity(query.len() + 8);
+    for term in query.split_whitespace() {
+        if !out.is_empty() {
+            out.push(' ');
+        }
+        out.push('"');
+        for ch in term.chars() {
+            if ch == '"' {
+                out.push('"');
+            }
+            out.push(ch);
+        }
+        out.push('"');
+    }
+    out
 }
 
 fn text_search(
@@ -218,32 +233,27 @@ fn hybrid_search(
     let vec_results = vector_search(conn, query_vec, filter, candidate_limit, now)?;
     let text_results = text_search(conn, query_text, filter, candidate_limit, now)?;
 
-    // Build rank maps (1-indexed)
-    let mut vec_ranks: HashMap<String, usize> = HashMap::new();
-    for (i, m) in vec_results.iter().enumerate() {
-        vec_ranks.insert(m.id.clone(), i + 1);
+    // One map of candidate -> (memory, vec rank, text rank), ranks 1-indexed.
+    // A side missing a candidate keeps the sentinel rank candidate_limit + 1.
+    let missing = candidate_limit + 1;
+    let mut candidates: HashMap<String, (Memory, usize, usize)> =
+        HashMap::with_capacity(vec_results.len() + text_results.len());
+    for (i, m) in vec_results.into_iter().enumerate() {
+        candidates.insert(m.id.clone(), (m, i + 1, missing));
     }
-
-    let mut text_ranks: HashMap<String, usize> = HashMap::new();
-    for (i, m) in text_results.iter().enumerate() {
-        text_ranks.insert(m.id.clone(), i + 1);
-    }
-
-    // Collect all unique candidates
-    let mut all_memories: HashMap<String, Memory> = HashMap::new();
-    for m in vec_results {
-        all_memories.insert(m.id.clone(), m);
-    }
-    for m in text_results {
-        all_memories.entry(m.id.clone()).or_insert(m);
+    for (i, m) in text_results.into_iter().enumerate() {
+        match candidates.entry(m.id.clone()) {
+            Entry::Occupied(mut e) => e.get_mut().2 = i + 1,
+            Entry::Vacant(e) => {
+                e.insert((m, missing, i + 1));
+            }
+        }
     }
 
     // Compute RRF scores (access boost already applied in sub-searches)
-    let mut scored: Vec<(Memory, f32)> = all_memories
+    let mut scored: Vec<(Memory, f32)> = candidates
         .into_values()
-        .map(|m| {
-            let vec_rank = vec_ranks.get(&m.id).copied().unwrap_or(candidate_limit + 1);
-            let text_rank = text_ranks.get(&m.id).copied().unwrap_or(candidate_limit + 1);
+        .map(|(m, vec_rank, text_rank)| {
             let rrf = 1.0 / (RRF_K + vec_rank as f32) + 1.0 / (RRF_K + text_rank as f32);
             (m, rrf)
         })
@@ -1,17 +1,9 @@
 use rusqlite::params;
 use serde_json::Value;
 use std::collections::HashMap;
-use std::time::{SystemTime, UNIX_EPOCH};
 
 use crate::types::{InsertResult, Memory, MemoriError, Result, SortField};
-use crate::util::{blob_to_vec, cosine_similarity, vec_to_blob};
-
-fn now() -> f64 {
-    SystemTime::now()
-        .duration_since(UNIX_EPOCH)
-        .unwrap()
-        .as_secs_f64()
-}
+use crate::util::{blob_to_vec, cosine_similarity, now_secs, vec_to_blob};
 
 /// Auto-generate an embedding for content if no explicit vector is provided.
 /// Returns the vector to use (either the explicit one or the auto-generated one).
@@ -51,7 +43,7 @@ pub fn find_duplicate(
         ),
     };
 
-    let mut stmt = conn.prepare(sql)?;
+    let mut stmt = conn.prepare_cached(sql)?;
     let mut rows = if has_param {
         stmt.query(params![type_filter.unwrap()])?
     } else {
@@ -84,7 +76,7 @@ pub fn insert(
     no_embed: bool,
 ) -> Result<InsertResult> {
     let id = uuid::Uuid::new_v4().to_string();
-    let ts = now();
+    let ts = now_secs();
 
     // Auto-embed if no explicit vector and not suppressed
     let auto_vec = if no_embed {
@@ -102,8 +94,13 @@ pub fn insert(
             .and_then(|t| t.as_str());
 
         if let Some(dup_id) = find_duplicate(conn, vec, type_filter, threshold)? {
-            // Update the existing memory instead of creating a new one
-            update(conn, &dup_id, Some(content), Some(vec), metadata, false)?;
+            // Update the existing memory instead of creating a new one. An
+            // identical re-store still counts as fresh: bump updated_at even
+            // when update() finds nothing to rewrite.
+            if !update(conn, &dup_id, Some(content), Some(vec), metadata, false)? {
+                conn.prepare_cached("UPDATE memories SET updated_at = ?1 WHERE id = ?2")?
+                    .execute(params![ts, dup_id])?;
+            }
             return Ok(InsertResult::Deduplicated(dup_id));
         }
     }
@@ -111,11 +108,11 @@ pub fn insert(
     let vector_blob = effective_vec.map(vec_to_blob);
     let metadata_str = metadata.map(|m| m.to_string());
 
-    conn.execute(
+    conn.prepare_cached(
         "INSERT INTO memories (id, content, vector, metadata, created_at, updated_at)
          VALUES (?1, ?2, ?3, ?4, ?5, ?6)",
-        params![id, content, vector_blob, metadata_str, ts, ts],
-    )?;
+    )?
+    .execute(params![id, content, vector_blob, metadata_str, ts, ts])?;
 
     Ok(InsertResult::Created(id))
 }
@@ -136,17 +133,24 @@ pub fn insert_with_id(
     let vector_blob = effective_vec.map(vec_to_blob);
     let metadata_str = metadata.map(|m| m.to_string());
 
-    conn.execute(
+    conn.prepare_cached(
         "INSERT INTO memories (id, content, vector, metadata, created_at, updated_at)
          VALUES (?1, ?2, ?3, ?4, ?5, ?6)",
-        params![id, content, vector_blob, metadata_str, created_at, updated_at],
-    )?;
+    )?
+    .execute(params![
+        id,
+        content,
+        vector_blob,
+        metadata_str,
+        created_at,
+        updated_at
+    ])?;
 
     Ok(id.to_string())
 }
 
 pub fn get(conn: &rusqlite::Connection, id: &str) -> Result<Option<Memory>> {
-    let mut stmt = conn.prepare(
+    let mut stmt = conn.prepare_cached(
         "SELECT id, content, vector, metadata, created_at, updated_at, last_accessed, access_count
          FROM memories WHERE id = ?1",
     )?;
@@ -201,6 +205,7 @@ fn metadata_values_text(metadata: &Value) -> String {
     }
 }
 
+/// Returns whether the row was written; `false` when nothing would change.
 pub fn update(
     conn: &rusqlite::Connection,
     id: &str,
@@ -208,84 +213,77 @@ pub fn update(
     vector: Option<&[f32]>,
     metadata: Option<Value>,
     merge_metadata: bool,
-) -> Result<()> {
+) -> Result<bool> {
     let existing = get_raw(conn, id)?;
     let existing = existing.ok_or_else(|| MemoriError::NotFound(id.to_string()))?;
 
-    let ts = now();
-
-    if let Some(content) = content {
-        conn.execute(
-            "UPDATE memories SET content = ?1, updated_at = ?2 WHERE id = ?3",
-            params![content, ts, id],
-        )?;
-
-        // Re-embed if content changes and no explicit vector provided
-        if vector.is_none() {
-            let auto_vec = auto_embed(content, None);
-            if let Some(v) = auto_vec {
-                let blob = vec_to_blob(&v);
-                conn.execute(
-                    "UPDATE memories SET vector = ?1 WHERE id = ?2",
-                    params![blob, id],
-                )?;
-            }
-        }
-    }
-
-    if let Some(v) = vector {
-        let blob = vec_to_blob(v);
-        conn.execute(
-            "UPDATE memories SET vector = ?1, updated_at = ?2 WHERE id = ?3",
-            params![blob, ts, id],
-        )?;
+    if content.is_none() && vector.is_none() && metadata.is_none() {
+        return Ok(false);
     }
 
-    if let Some(new_meta) = metadata {
-        let final_meta = if merge_metadata {
+    let final_meta = metadata.map(|new_meta| {
+        if merge_metadata {
             match &existing.metadata {
                 Some(existing_meta) => merge_json(existing_meta, &new_meta),
                 None => new_meta,
             }
         } else {
             new_meta
-        };
-
-        let json_str = final_meta.to_string();
-        conn.execute(
-            "UPDATE memories SET metadata = ?1, updated_at = ?2 WHERE id = ?3",
-            params![json_str, ts, id],
-        )?;
-
-        // Re-embed when metadata changes so vector search finds tagged content.
-        // FTS5 triggers already handle text search via the update trigger, but
-        // the vector embedding needs explicit regeneration.
-        if vector.is_none() {
-            // Use current content (possibly just updated above)
-            let current_content = content.map(|s| s.to_string()).unwrap_or(existing.content);
-            let meta_text = metadata_values_text(&final_meta);
-            let embed_text = if meta_text.is_empty() {
-                current_content
-            } else {
-                format!("{} {}", current_content, meta_text)
-            };
-            let auto_vec = auto_embed(&embed_text, None);
-            if let Some(v) = auto_vec {
-                let blob = vec_to_blob(&v);
-                conn.execute(
-                    "UPDATE memories SET vector = ?1 WHERE id = ?2",
-                    params![blob, id],
-                )?;
-            }
         }
+    });
+
+    // Nothing would change (same content, vector and resulting metadata,
+    // e.g. re-tagging an existing key=value): skip the embedding, the write,
+    // the FTS5 trigger and the updated_at bump. An unembedded row (NULL
+    // vector) never counts as unchanged: a supplied vector differs from it,
+    // and otherwise the write below is what embeds it.
+    let unchanged = existing.vector.is_some()
+        && content.map_or(true, |c| c == existing.content)
+        && vector.map_or(true, |v| existing.vector.as_deref() == Some(v))
+        && final_meta
+            .as_ref()
+            .map_or(true, |m| existing.metadata.as_ref() == Some(m));
+    if unchanged {
+        return Ok(false);
     }
 
-    Ok(())
+    // Work out the one vector to store before touching the row, so the model
+    // runs at most once and outside any write lock. An explicit vector wins.
+    // Otherwise a metadata change re-embeds content plus metadata values (so
+    // vector search finds tagged content; FTS5 is handled by the update
+    // trigger), and a content-only change re-embeds the new content.
+    let auto_vec = if vector.is_some() {
+        None
+    } else if let Some(meta) = &final_meta {
+        let current_content = content.unwrap_or(existing.content.as_str());
+        let meta_text = metadata_values_text(meta);
+        if meta_text.is_empty() {
+            auto_embed(current_content, None)
+        } else {
+            auto_embed(&format!("{} {}", current_content, meta_text), None)
+        }
+    } else if let Some(content) = content {
+        auto_embed(content, None)
+    } else {
+        None
+    };
+    let vector_blob = vector.or(auto_vec.as_deref()).map(vec_to_blob);
+    let metadata_str = final_meta.map(|m| m.to_string());
+
+    // One UPDATE: a single statement commit and a single FTS5 trigger run.
+    // NULL parameters leave the column as it is.
+    conn.prepare_cached(
+        "UPDATE memories SET content = COALESCE(?1, content), vector = COALESCE(?2, vector),
+         metadata = COALESCE(?3, metadata), updated_at = ?4 WHERE id = ?5",
+    )?
+    .execute(params![content, vector_blob, metadata_str, now_secs(), id])?;
+
+    Ok(true)
 }
 
 /// Raw get without touching access count (avoids infinite recursion in update path)
 pub fn get_raw(conn: &rusqlite::Connection, id: &str) -> Result<Option<Memory>> {
-    let mut stmt = conn.prepare(
+    let mut stmt = conn.prepare_cached(
         "SELECT id, content, vector, metadata, created_at, updated_at, last_accessed, access_count
          FROM memories WHERE id = ?1",
     )?;
@@ -298,16 +296,18 @@ pub fn get_raw(conn: &rusqlite::Connection, id: &str) -> Result<Option<Memory>>
 }
 
 pub fn touch(conn: &rusqlite::Connection, id: &str) -> Result<()> {
-    let ts = now();
-    conn.execute(
+    let ts = now_secs();
+    conn.prepare_cached(
         "UPDATE memories SET last_accessed = ?1, access_count = access_count + 1 WHERE id = ?2",
-        params![ts, id],
-    )?;
+    )?
+    .execute(params![ts, id])?;
     Ok(())
 }
 
 pub fn delete(conn: &rusqlite::Connection, id: &str) -> Result<()> {
-    let affected = conn.execute("DELETE FROM memories WHERE id = ?1", params![id])?;
+    let affected = conn
+        .prepare_cached("DELETE FROM memories WHERE id = ?1")?
+        .execute(params![id])?;
     if affected == 0 {
         return Err(MemoriError::NotFound(id.to_string()));
     }
@@ -319,16 +319,13 @@ pub fn count(conn: &rusqlite::Connection) -> Result<usize> {
     Ok(c as usize)
 }
 
-pub fn list(
-    conn: &rusqlite::Connection,
+/// Build the WHERE clause shared by `list` and `count_filtered`.
+/// Returns the clause (empty when unfiltered) and its positional params.
+fn filter_clause(
     type_filter: Option<&str>,
-    sort: &SortField,
-    limit: usize,
-    offset: usize,
     before: Option<f64>,
     after: Option<f64>,
-) -> Result<Vec<Memory>> {
-    // Build WHERE conditions dynamically
+) -> (String, Vec<Box<dyn rusqlite::types::ToSql>>) {
     let mut conditions: Vec<String> = Vec::new();
     let mut param_values: Vec<Box<dyn rusqlite::types::ToSql>> = Vec::new();
 
@@ -348,6 +345,34 @@ pub fn list(
     } else {
         format!("WHERE {}", conditions.join(" AND "))
     };
+    (where_clause, param_values)
+}
+
+/// Count memories matching the same filters as `list`, without loading rows.
+pub fn count_filtered(
+    conn: &rusqlite::Connection,
+    type_filter: Option<&str>,
+    before: Option<f64>,
+    after: Option<f64>,
+) -> Result<usize> {
+    let (where_clause, param_values) = filter_clause(type_filter, before, after);
+    let sql = format!("SELECT COUNT(*) FROM memories {}", where_clause);
+    let param_refs: Vec<&dyn rusqlite::types::ToSql> =
+        param_values.iter().map(|p| p.as_ref()).collect();
+    let c: i64 = conn.query_row(&sql, param_refs.as_slice(), |row| row.get(0))?;
+    Ok(c as usize)
+}
+
+pub fn list(
+    conn: &rusqlite::Connection,
+    type_filter: Option<&str>,
+    sort: &SortField,
+    limit: usize,
+    offset: usize,
+    before: Option<f64>,
+    after: Option<f64>,
+) -> Result<Vec<Memory>> {
+    let (where_clause, mut param_values) = filter_clause(type_filter, before, after);
 
     // Limit and offset are the next positional params
     let limit_idx = param_values.len() + 1;
@@ -405,9 +430,77 @@ pub fn delete_by_type(conn: &rusqlite::Connection, type_value: &str) -> Result<u
     Ok(affected)
 }
 
+/// Delete memories matching all given list-style filters in one statement.
+/// At least one filter is required so a bare call cannot wipe the table.
+pub fn delete_filtered(
+    conn: &rusqlite::Connection,
+    type_filter: Option<&str>,
+    before: Option<f64>,
+    after: Option<f64>,
+) -> Result<usize> {
+    if type_filter.is_none() && before.is_none() && after.is_none() {
+        return Err(MemoriError::InvalidFilter(
+            "delete_filtered needs at least one of type, before or after".to_string(),
+        ));
+    }
+    let (where_clause, param_values) = filter_clause(type_filter, before, after);
+    let sql = format!("DELETE FROM memories {}", where_clause);
+    let param_refs: Vec<&dyn rusqlite::types::ToSql> =
+        param_values.iter().map(|p| p.as_ref()).collect();
+    let affected = conn.execute(&sql, param_refs.as_slice())?;
+    Ok(affected)
+}
+
+/// Open an explicit write transaction. Every write until `commit` shares one
+/// journal sync instead of paying for an implicit commit per statement.
+pub fn begin(conn: &rusqlite::Connection) -> Result<()> {
+    conn.execute_batch("BEGIN IMMEDIATE")?;
+    Ok(())
+}
+
+/// Commit the open transaction. No-op when none is active.
+pub fn commit(conn: &rusqlite::Connection) -> Result<()> {
+    if !conn.is_autocommit() {
+        conn.execute_batch("COMMIT")?;
+    }
+    Ok(())
+}
+
+/// Roll back the open transaction. No-op when none is active, so error
+/// handlers can call it unconditionally.
+pub fn rollback(conn: &rusqlite::Connection) -> Result<()> {
+    if !conn.is_autocommit() {
+        conn.execute_batch("ROLLBACK")?;
+    }
+    Ok(())
+}
+
+/// Mark a savepoint inside the open transaction, so one unit of work can be
+/// undone with `rollback_to_savepoint` without discarding the rest.
+pub fn savepoint(conn: &rusqlite::Connection) -> Result<()> {
+    conn.execute_batch("SAVEPOINT memori_sp")?;
+    Ok(())
+}
+
+/// Keep the work done since `savepoint` (it commits with the transaction).
+pub fn release_savepoint(conn: &rusqlite::Connection) -> Result<()> {
+    conn.execute_batch("RELEASE memori_sp")?;
+    Ok(())
+}
+
+/// Undo the work done since `savepoint` and drop the savepoint.
+pub fn rollback_to_savepoint(conn: &rusqlite::Connection) -> Result<()> {
+    conn.execute_batch("ROLLBACK TO memori_sp; RELEASE memori_sp")?;
+    Ok(())
+}
+
 /// Run SQLite VACUUM to compact the database file.
+/// In WAL mode VACUUM writes the rebuilt pages into the WAL, so a TRUNCATE
+/// checkpoint follows: it copies them back, shrinks the main file, and
+/// resets the WAL to zero bytes instead of leaving a database-sized log.
 pub fn vacuum(conn: &rusqlite::Connection) -> Result<()> {
     conn.execute_batch("VACUUM")?;
+    conn.query_row("PRAGMA wal_checkpoint(TRUNCATE)", [], |_| Ok(()))?;
     Ok(())
 }
 
@@ -419,10 +512,9 @@ pub fn set_access_stats(
     last_accessed: Option<f64>,
     access_count: i64,
 ) -> Result<()> {
-    let affected = conn.execute(
-        "UPDATE memories SET last_accessed = ?1, access_count = ?2 WHERE id = ?3",
-        params![last_accessed, access_count, id],
-    )?;
+    let affected = conn
+        .prepare_cached("UPDATE memories SET last_accessed = ?1, access_count = ?2 WHERE id = ?3")?
+        .execute(params![last_accessed, access_count, id])?;
     if affected == 0 {
         return Err(MemoriError::NotFound(id.to_string()));
     }
@@ -431,12 +523,11 @@ pub fn set_access_stats(
 
 /// Return (embedded_count, total_count) for embedding coverage stats
 pub fn embedding_stats(conn: &rusqlite::Connection) -> Result<(usize, usize)> {
-    let total: i64 = conn.query_row("SELECT COUNT(*) FROM memories", [], |row| row.get(0))?;
-    let embedded: i64 = conn.query_row(
-        "SELECT COUNT(*) FROM memories WHERE vector IS NOT NULL",
-        [],
-        |row| row.get(0),
-    )?;
+    // One pass for both counts; COUNT(vector) skips NULLs.
+    let (total, embedded): (i64, i64) =
+        conn.query_row("SELECT COUNT(*), COUNT(vector) FROM memories", [], |row| {
+            Ok((row.get(0)?, row.get(1)?))
+        })?;
     Ok((embedded as usize, total as usize))
 }
 
@@ -454,9 +545,8 @@ pub fn backfill_embeddings(conn: &rusqlite::Connection, batch_size: usize) -> Re
         let mut total_processed = 0usize;
 
         loop {
-            let mut stmt = conn.prepare(
-                "SELECT id, content FROM memories WHERE vector IS NULL LIMIT ?1",
-            )?;
+            let mut stmt = conn
+                .prepare_cached("SELECT id, content FROM memories WHERE vector IS NULL LIMIT ?1")?;
             let mut rows = stmt.query(params![batch_size as i64])?;
 
             let mut batch: Vec<(String, String)> = Vec::new();
@@ -473,12 +563,24 @@ pub fn backfill_embeddings(conn: &rusqlite::Connection, batch_size: usize) -> Re
             let texts: Vec<&str> = batch.iter().map(|(_, c)| c.as_str()).collect();
             let embeddings = crate::embed::embed_batch(&texts);
 
-            for ((id, _), embedding) in batch.iter().zip(embeddings.iter()) {
-                let blob = vec_to_blob(embedding);
-                conn.execute(
-                    "UPDATE memories SET vector = ?1 WHERE id = ?2",
-                    params![blob, id],
-                )?;
+            // Write the whole batch in one transaction with one prepared
+            // statement: a single commit instead of an implicit one per row.
+            // Inside a caller's begin()/commit() the outer transaction is reused.
+            let tx = if conn.is_autocommit() {
+                Some(conn.unchecked_transaction()?)
+            } else {
+                None
+            };
+            {
+                let mut update_stmt =
+                    conn.prepare_cached("UPDATE memories SET vector = ?1 WHERE id = ?2")?;
+                for ((id, _), embedding) in batch.iter().zip(embeddings.iter()) {
+                    let blob = vec_to_blob(embedding);
+                    update_stmt.execute(params![blob, id])?;
+                }
+            }
+            if let Some(tx) = tx {
+                tx.commit()?;
             }
 
             total_processed += batch.len();
@@ -496,32 +598,84 @@ pub fn resolve_prefix(conn: &rusqlite::Connection, prefix: &str) -> Result<Strin
         return Ok(prefix.to_string());
     }
 
-    let mut stmt = conn.prepare("SELECT id FROM memories WHERE id LIKE ?1 || '%' LIMIT 2")?;
-    let mut rows = stmt.query(params![prefix])?;
-
-    let first = match rows.next()? {
-        Some(row) => {
-            let id: String = row.get(0)?;
-            id
+    // Ids starting with `prefix` sort in [prefix, upper): a range seek on the
+    // primary-key index instead of a LIKE scan over every id. The seek is
+    // exact only for a lower-case hex prefix (no LIKE wildcards) against
+    // canonical lower-case ids, since LIKE is case-insensitive. When other
+    // ids exist (checked via the partial noncanonical-id index) and the seek
+    // found fewer than two matches, LIKE decides, so a prefix shared with an
+    // imported mixed-case id is still reported as ambiguous.
+    let lowered = prefix.to_ascii_lowercase();
+    let upper = prefix_upper_bound(&lowered);
+    let hex_prefix = !lowered.is_empty()
+        && lowered
+            .bytes()
+            .all(|b| matches!(b, b'0'..=b'9' | b'a'..=b'f' | b'-'));
+    let mut ids: Vec<String> = Vec::with_capacity(2);
+    let mut by_range = false;
+    if hex_prefix {
+        let mut stmt =
+            conn.prepare_cached("SELECT id FROM memories WHERE id >= ?1 AND id < ?2 LIMIT 2")?;
+        for id in stmt.query_map(params![lowered, upper], |row| row.get(0))? {
+            ids.push(id?);
         }
-        None => return Err(MemoriError::NotFound(prefix.to_string())),
-    };
+        by_range = ids.len() >= 2 || !has_noncanonical_ids(conn)?;
+    }
+    if !by_range {
+        ids.clear();
+        let mut stmt =
+            conn.prepare_cached("SELECT id FROM memories WHERE id LIKE ?1 || '%' LIMIT 2")?;
+        for id in stmt.query_map(params![prefix], |row| row.get(0))? {
+            ids.push(id?);
+        }
+    }
 
-    // Check if there's a second match
-    if rows.next()?.is_some() {
-        // Count total matches for the error message
-        let count: i64 = conn.query_row(
-            "SELECT COUNT(*) FROM memories WHERE id LIKE ?1 || '%'",
-            params![prefix],
-            |row| row.get(0),
-        )?;
-        return Err(MemoriError::AmbiguousPrefix(
-            prefix.to_string(),
-            count as usize,
-        ));
+    match ids.len() {
+        0 => Err(MemoriError::NotFound(prefix.to_string())),
+        1 => Ok(ids.pop().unwrap()),
+        _ => {
+            // Count total matches for the error message; the range count
+            // would miss ids that only LIKE matches
+            let count: i64 = if by_range && !has_noncanonical_ids(conn)? {
+                conn.query_row(
+                    "SELECT COUNT(*) FROM memories WHERE id >= ?1 AND id < ?2",
+                    params![lowered, upper],
+                    |row| row.get(0),
+                )?
+            } else {
+                conn.query_row(
+                    "SELECT COUNT(*) FROM memories WHERE id LIKE ?1 || '%'",
+                    params![prefix],
+                    |row| row.get(0),
+                )?
+            };
+            Err(MemoriError::AmbiguousPrefix(
+                prefix.to_string(),
+                count as usize,
+            ))
+        }
     }
+}
+
+/// Whether any id is outside canonical lower-case UUID text. The WHERE
+/// clause matches idx_memories_noncanonical_id, so this reads that
+/// (normally empty) partial index rather than every id.
+fn has_noncanonical_ids(conn: &rusqlite::Connection) -> Result<bool> {
+    let exists: bool = conn
+        .prepare_cached("SELECT EXISTS(SELECT 1 FROM memories WHERE id GLOB '*[^0-9a-f-]*')")?
+        .query_row([], |row| row.get(0))?;
+    Ok(exists)
+}
 
-    Ok(first)
+/// Smallest string that sorts after every string starting with `prefix`:
+/// the prefix with its last char bumped by one code point. SQLite's default
+/// BINARY collation compares UTF-8 bytes, which preserves code point order.
+fn prefix_upper_bound(prefix: &str) -> Option<String> {
+    let last = prefix.chars().next_back()?;
+    let next = char::from_u32(last as u32 + 1)?;
+    let mut upper = prefix[..prefix.len() - last.len_utf8()].to_string();
+    upper.push(next);
+    Some(upper)
 }
 
 pub fn row_to_memory(row: &rusqlite::Row) -> rusqlite::Result<Memory> {
@@ -1,4 +1,6 @@
-/// Shared low-level utilities for vector serialization and similarity.
+use std::time::{SystemTime, UNIX_EPOCH};
+
+/// Shared low-level utilities for vector serialization, similarity, and timestamps.
 
 /// Convert a float vector to a raw byte slice for SQLite BLOB storage.
 ///
@@ -54,6 +56,14 @@ pub fn cosine_similarity(a: &[f32], b: &[f32]) -> f32 {
     }
 }
 
+/// Current wall-clock time as Unix seconds, the unit of every timestamp column.
+pub fn now_secs() -> f64 {
+    SystemTime::now()
+        .duration_since(UNIX_EPOCH)
+        .unwrap()
+        .as_secs_f64()
+}
+
 #[cfg(test)]
 mod tests {
     use super::*;
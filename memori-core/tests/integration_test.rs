@@ -1,4 +1,4 @@
-use memori_core::{InsertResult, Memori, SearchQuery, SortField};
+use memori_core::{InsertResult, Memori, MemoriError, SearchQuery, SortField};
 use serde_json::json;
 use std::time::{SystemTime, UNIX_EPOCH};
 
@@ -179,6 +179,43 @@ fn test_vector_search_cosine_similarity() {
     assert!(results[1].score.unwrap() > results[2].score.unwrap());
 }
 
+#[test]
+fn test_vector_search_top_k_loads_full_rows() {
+    let db = open_temp();
+
+    db.insert("no vector", None, Some(json!({"type": "fact"})), None, true)
+        .unwrap();
+    db.insert(
+        "near",
+        Some(&[1.0, 0.0, 0.0]),
+        Some(json!({"type": "fact"})),
+        None,
+        false,
+    )
+    .unwrap();
+    db.insert(
+        "far",
+        Some(&[0.0, 1.0, 0.0]),
+        Some(json!({"type": "fact"})),
+        None,
+        false,
+    )
+    .unwrap();
+
+    let query = SearchQuery {
+        vector: Some(vec![1.0, 0.0, 0.0]),
+        limit: 1,
+        ..Default::default()
+    };
+
+    let results = db.search(query).unwrap();
+    assert_eq!(results.len(), 1);
+    assert_eq!(results[0].content, "near");
+    assert_eq!(results[0].metadata, Some(json!({"type": "fact"})));
+    assert_eq!(results[0].vector.as_deref(), Some(&[1.0f32, 0.0, 0.0][..]));
+    assert!(results[0].score.is_some());
+}
+
 #[test]
 fn test_text_search_fts5() {
     let db = open_temp();
@@ -458,6 +495,54 @@ fn test_delete_by_type() {
     assert_eq!(db.count().unwrap(), 2);
 }
 
+#[test]
+fn test_delete_filtered_and_logic() {
+    let db = open_temp();
+    let now = SystemTime::now()
+        .duration_since(UNIX_EPOCH)
+        .unwrap()
+        .as_secs_f64();
+
+    db.insert_with_id(
+        "old-tmp",
+        "old temp",
+        None,
+        Some(json!({"type": "temporary"})),
+        now - 7200.0,
+        now - 7200.0,
+    )
+    .unwrap();
+    db.insert_with_id(
+        "old-fact",
+        "old fact",
+        None,
+        Some(json!({"type": "fact"})),
+        now - 7200.0,
+        now - 7200.0,
+    )
+    .unwrap();
+    db.insert(
+        "new temp",
+        None,
+        Some(json!({"type": "temporary"})),
+        None,
+        false,
+    )
+    .unwrap();
+
+    // Only rows matching both type and date go
+    let deleted = db
+        .delete_filtered(Some("temporary"), Some(now - 3600.0), None)
+        .unwrap();
+    assert_eq!(deleted, 1);
+    assert!(db.get_readonly("old-tmp").unwrap().is_none());
+    assert_eq!(db.count().unwrap(), 2);
+
+    // No filters is rejected rather than wiping the table
+    assert!(db.delete_filtered(None, None, None).is_err());
+    assert_eq!(db.count().unwrap(), 2);
+}
+
 #[test]
 fn test_fts5_hyphenated_search() {
     let db = open_temp();
@@ -938,6 +1023,122 @@ fn test_prefix_ambiguous() {
     assert_eq!(mem.content, "first");
 }
 
+#[test]
+fn test_prefix_range_boundaries() {
+    let db = open_temp();
+    db.insert_with_id(
+        "abc11111-1111-1111-1111-111111111111",
+        "abc",
+        None,
+        None,
+        1.0,
+        1.0,
+    )
+    .unwrap();
+    db.insert_with_id(
+        "abd22222-2222-2222-2222-222222222222",
+        "abd",
+        None,
+        None,
+        1.0,
+        1.0,
+    )
+    .unwrap();
+    db.insert_with_id("ab", "short id", None, None, 1.0, 1.0)
+        .unwrap();
+
+    // "abc" must not pick up the neighbouring "abd..." id
+    assert_eq!(
+        db.resolve_id("abc").unwrap(),
+        "abc11111-1111-1111-1111-111111111111"
+    );
+    // An id equal to the prefix is a match too, so "ab" is ambiguous (3 ids)
+    let err = db.resolve_id("ab").unwrap_err().to_string();
+    assert!(err.contains("3"));
+    // Upper-case input is lower-cased before the range seek
+    assert_eq!(
+        db.resolve_id("ABD2").unwrap(),
+        "abd22222-2222-2222-2222-222222222222"
+    );
+    assert!(matches!(
+        db.resolve_id("zzz"),
+        Err(MemoriError::NotFound(_))
+    ));
+}
+
+#[test]
+fn test_prefix_mixed_case() {
+    let db = open_temp();
+    db.insert_with_id(
+        "abc11111-1111-1111-1111-111111111111",
+        "abc",
+        None,
+        None,
+        1.0,
+        1.0,
+    )
+    .unwrap();
+    db.insert_with_id(
+        "abc22222-2222-2222-2222-222222222222",
+        "abc 2",
+        None,
+        None,
+        1.0,
+        1.0,
+    )
+    .unwrap();
+    db.insert_with_id("IMPORTED-Id", "imported", None, None, 1.0, 1.0)
+        .unwrap();
+
+    // Mixed-case prefixes behave like their lower-case form on the range path
+    assert_eq!(
+        db.resolve_id("AbC1").unwrap(),
+        "abc11111-1111-1111-1111-111111111111"
+    );
+    let err = db.resolve_id("ABC").unwrap_err();
+    assert!(matches!(err, MemoriError::AmbiguousPrefix(_, 2)));
+    // Ids stored in another case are still found through the LIKE fallback
+    assert_eq!(db.resolve_id("imported").unwrap(), "IMPORTED-Id");
+}
+
+#[test]
+fn test_prefix_shared_with_upper_case_import_is_ambiguous() {
+    let db = open_temp();
+    db.insert_with_id(
+        "abc11111-1111-1111-1111-111111111111",
+        "generated",
+        None,
+        None,
+        1.0,
+        1.0,
+    )
+    .unwrap();
+    db.insert_with_id(
+        "ABC99999-9999-9999-9999-999999999999",
+        "imported",
+        None,
+        None,
+        1.0,
+        1.0,
+    )
+    .unwrap();
+
+    // The range seek alone sees only the lower-case id; LIKE confirms both
+    let err = db.resolve_id("abc").unwrap_err();
+    assert!(matches!(err, MemoriError::AmbiguousPrefix(_, 2)));
+    assert!(db.delete("abc").is_err());
+    assert_eq!(db.count().unwrap(), 2);
+    // Longer prefixes still tell them apart, in either case
+    assert_eq!(
+        db.resolve_id("abc1").unwrap(),
+        "abc11111-1111-1111-1111-111111111111"
+    );
+    assert_eq!(
+        db.resolve_id("abc9").unwrap(),
+        "ABC99999-9999-9999-9999-999999999999"
+    );
+}
+
 // -- v0.5 tests: decay-aware scoring --
 
 #[test]
@@ -1090,6 +1291,193 @@ fn test_list_combined_type_and_date() {
     assert_eq!(results[0].content, "old fact");
 }
 
+#[test]
+fn test_count_filtered_matches_list() {
+    let db = open_temp();
+    let now = SystemTime::now()
+        .duration_since(UNIX_EPOCH)
+        .unwrap()
+        .as_secs_f64();
+
+    db.insert_with_id(
+        "old-fact",
+        "old fact",
+        None,
+        Some(json!({"type": "fact"})),
+        now - 7200.0,
+        now - 7200.0,
+    )
+    .unwrap();
+    db.insert_with_id(
+        "old-pref",
+        "old pref",
+        None,
+        Some(json!({"type": "preference"})),
+        now - 7200.0,
+        now - 7200.0,
+    )
+    .unwrap();
+    db.insert("new fact", None, Some(json!({"type": "fact"})), None, false)
+        .unwrap();
+
+    assert_eq!(db.count_filtered(None, None, None).unwrap(), 3);
+    assert_eq!(db.count_filtered(Some("fact"), None, None).unwrap(), 2);
+    assert_eq!(
+        db.count_filtered(None, Some(now - 3600.0), None).unwrap(),
+        2
+    );
+    assert_eq!(
+        db.count_filtered(Some("fact"), Some(now - 3600.0), None)
+            .unwrap(),
+        1
+    );
+    assert_eq!(
+        db.count_filtered(None, None, Some(now - 3600.0)).unwrap(),
+        1
+    );
+    assert_eq!(db.count_filtered(Some("nope"), None, None).unwrap(), 0);
+}
+
+#[test]
+fn test_update_noop_skips_write() {
+    let db = open_temp();
+    db.insert_with_id(
+        "noop-1",
+        "same",
+        Some(&[1.0, 0.0]),
+        Some(json!({"topic": "x"})),
+        1.0,
+        1.0,
+    )
+    .unwrap();
+
+    // Identical content, vector and merged metadata: row left untouched
+    db.update(
+        "noop-1",
+        Some("same"),
+        Some(&[1.0, 0.0]),
+        Some(json!({"topic": "x"})),
+        true,
+    )
+    .unwrap();
+    let mem = db.get_readonly("noop-1").unwrap().unwrap();
+    assert_eq!(mem.updated_at, 1.0);
+
+    // A real change still writes and bumps updated_at
+    db.update("noop-1", None, None, Some(json!({"topic": "y"})), true)
+        .unwrap();
+    let mem = db.get_readonly("noop-1").unwrap().unwrap();
+    assert!(mem.updated_at > 1.0);
+    assert_eq!(mem.metadata, Some(json!({"topic": "y"})));
+}
+
+#[test]
+fn test_update_vector_on_unembedded_row_writes() {
+    let db = open_temp();
+    db.insert_with_id("novec-1", "same", None, None, 1.0, 1.0)
+        .unwrap();
+
+    // A NULL stored vector never equals a supplied one, so this is a change
+    db.update("novec-1", Some("same"), Some(&[1.0, 0.0]), None, false)
+        .unwrap();
+    let mem = db.get_readonly("novec-1").unwrap().unwrap();
+    assert_eq!(mem.vector, Some(vec![1.0, 0.0]));
+    assert!(mem.updated_at > 1.0);
+}
+
+#[test]
+fn test_update_same_content_embeds_unembedded_row() {
+    let db = open_temp();
+    db.insert_with_id("novec-2", "same", None, None, 1.0, 1.0)
+        .unwrap();
+
+    // Same content, but the row has no vector yet: not a no-op, so the
+    // update runs (and embeds the row when embeddings are built in)
+    db.update("novec-2", Some("same"), None, None, false)
+        .unwrap();
+    let mem = db.get_readonly("novec-2").unwrap().unwrap();
+    assert!(mem.updated_at > 1.0);
+    assert_eq!(mem.content, "same");
+    #[cfg(feature = "embeddings")]
+    assert!(mem.vector.is_some());
+}
+
+#[test]
+fn test_dedup_identical_restore_bumps_updated_at() {
+    let db = open_temp();
+    db.insert_with_id(
+        "dup-1",
+        "same",
+        Some(&[1.0, 0.0]),
+        Some(json!({"type": "fact"})),
+        1.0,
+        1.0,
+    )
+    .unwrap();
+
+    // Nothing differs, so update() skips the write, but storing again
+    // still marks the memory as fresh
+    let result = db
+        .insert(
+            "same",
+            Some(&[1.0, 0.0]),
+            Some(json!({"type": "fact"})),
+            Some(0.92),
+            false,
+        )
+        .unwrap();
+    assert!(matches!(result, InsertResult::Deduplicated(_)));
+    assert_eq!(result.id(), "dup-1");
+    let mem = db.get_readonly("dup-1").unwrap().unwrap();
+    assert!(mem.updated_at > 1.0);
+    assert_eq!(mem.content, "same");
+    assert_eq!(db.count().unwrap(), 1);
+}
+
+#[test]
+fn test_begin_commit_rollback() {
+    let db = open_temp();
+
+    db.begin().unwrap();
+    db.insert("rolled back", None, None, None, true).unwrap();
+    db.rollback().unwrap();
+    assert_eq!(db.count().unwrap(), 0);
+
+    db.begin().unwrap();
+    let id = db
+        .insert_with_id("kept", "kept", None, None, 1.0, 1.0)
+        .unwrap();
+    db.set_access_stats(&id, Some(2.0), 3).unwrap();
+    db.commit().unwrap();
+    let mem = db.get_readonly(&id).unwrap().unwrap();
+    assert_eq!(mem.access_count, 3);
+
+    // No open transaction: both are no-ops rather than errors
+    db.commit().unwrap();
+    db.rollback().unwrap();
+}
+
+#[test]
+fn test_savepoint_undoes_one_entry_only() {
+    let db = open_temp();
+
+    db.begin().unwrap();
+    db.savepoint().unwrap();
+    db.insert_with_id("keep", "kept", None, None, 1.0, 1.0)
+        .unwrap();
+    db.release_savepoint().unwrap();
+
+    db.savepoint().unwrap();
+    db.insert_with_id("drop", "dropped", None, None, 1.0, 1.0)
+        .unwrap();
+    db.rollback_to_savepoint().unwrap();
+    db.commit().unwrap();
+
+    assert!(db.get_readonly("keep").unwrap().is_some());
+    assert!(db.get_readonly("drop").unwrap().is_none());
+    assert_eq!(db.count().unwrap(), 1);
+}
+
 // --- FTS5 query sanitization edge cases ---
 
 #[test]
@@ -1184,3 +1572,18 @@ fn test_fts5_empty_query() {
     let results = db.search(query).unwrap();
     assert!(results.is_empty());
 }
+
+#[test]
+fn test_blank_query_without_text_only() {
+    let db = open_temp();
+    db.insert("some content", None, None, None, false).unwrap();
+
+    let query = SearchQuery {
+        text: Some("   ".to_string()),
+        limit: 10,
+        ..Default::default()
+    };
+    // Blank hybrid query skips embedding and matches nothing, same as text_only
+    let results = db.search(query).unwrap();
+    assert!(results.is_empty());
+}
@@ -1,7 +1,20 @@
 """Memori -- embedded AI agent memory (SQLite + vector search + FTS5).
 
-This package re-exports the native Rust extension's PyMemori class.
+This package re-exports the native Rust extension's PyMemori class and its
+exception types (all subclasses of RuntimeError).
 """
-from .memori import PyMemori
+from .memori import (
+    AmbiguousPrefixError,
+    InvalidQueryError,
+    InvalidVectorError,
+    NotFoundError,
+    PyMemori,
+)
 
-__all__ = ["PyMemori"]
+__all__ = [
+    "PyMemori",
+    "NotFoundError",
+    "AmbiguousPrefixError",
+    "InvalidVectorError",
+    "InvalidQueryError",
+]
@@ -20,27 +20,28 @@ Usage:
   memori setup --undo   # remove the snippet
 """
 import argparse
+import functools
 import json
 import os
+import re
 import sys
-import threading
-import webbrowser
 from datetime import datetime, timezone
-from http.server import HTTPServer, BaseHTTPRequestHandler
 from pathlib import Path
-from urllib.parse import parse_qs, urlparse
-
-from memori import PyMemori
 
 __version__ = "0.7.0"
 
 DEFAULT_DB = os.path.expanduser("~/.claude/memori.db")
 DEFAULT_DEDUP_THRESHOLD = 0.92
+_IMPORT_BATCH_SIZE = 500  # entries per import transaction
 
-KNOWN_TYPES = frozenset([
+_KNOWN_TYPES_ORDER = (
   "debugging", "decision", "architecture", "pattern",
   "preference", "fact", "roadmap", "temporary",
-])
+)
+KNOWN_TYPES = frozenset(_KNOWN_TYPES_ORDER)
+# Pre-joined for help epilogs (declaration order) and warnings (sorted)
+_KNOWN_TYPES_HELP = ", ".join(_KNOWN_TYPES_ORDER)
+_KNOWN_TYPES_SORTED = ", ".join(sorted(KNOWN_TYPES))
 
 SNIPPET_START_PREFIX = "<!-- memori:start"
 SNIPPET_END_PREFIX = "<!-- memori:end"
@@ -48,9 +49,13 @@ SNIPPET_START = f"<!-- memori:start v{__version__} -->"
 SNIPPET_END = f"<!-- memori:end v{__version__} -->"
 SNIPPET_REFERENCE_START = "<!-- memori:reference -->"
 SNIPPET_REFERENCE_END = "<!-- memori:reference:end -->"
+_SNIPPET_MARKER_RE = re.compile(r"<!-- memori:(start|end) v[^\s>]+ -->")
 
 
 def _get_db(path=None):
+  # Imported here so commands that never open a DB (setup, --help, --version)
+  # don't pay for loading the native extension.
+  from memori import PyMemori
   return PyMemori(path or DEFAULT_DB)
 
 
@@ -74,6 +79,7 @@ def _parse_json(value, flag_name, use_json=False):
     _err("invalid_json", f"Invalid JSON for {flag_name}: {e}", exit_code=2, use_json=use_json)
 
 
+@functools.lru_cache(maxsize=1)
 def _snippet_text():
   """Load the memori snippet from bundled data.
 
@@ -81,23 +87,13 @@ def _snippet_text():
   `<!-- memori:start v0.0.0 -->`. We rewrite both start and end markers
   to the current `__version__` so the snippet on disk always carries the
   installed package's version — independent of what version string is
-  committed in the data file.
+  committed in the data file. The result is cached: the file and version
+  are fixed for the life of the process.
   """
   data_dir = Path(__file__).parent / "data"
   snippet_file = data_dir / "claude_snippet.md"
   text = snippet_file.read_text()
-  import re
-  text = re.sub(
-    r"<!-- memori:start v[^\s>]+ -->",
-    f"<!-- memori:start v{__version__} -->",
-    text,
-  )
-  text = re.sub(
-    r"<!-- memori:end v[^\s>]+ -->",
-    f"<!-- memori:end v{__version__} -->",
-    text,
-  )
-  return text
+  return _SNIPPET_MARKER_RE.sub(rf"<!-- memori:\1 v{__version__} -->", text)
 
 
 def _find_snippet_markers(text):
@@ -172,12 +168,27 @@ def _parse_date_arg(value, use_json=False):
          exit_code=2, use_json=use_json)
 
 
+def _truncate(text, n):
+  """Cut text to n chars with a trailing "..." if it was longer (one len() call)."""
+  return text if len(text) <= n else text[:n] + "..."
+
+
 def _resolve_id(db, prefix):
   """Resolve a prefix to full UUID via get_readonly(). Returns the full ID or the prefix if unresolvable."""
-  mem = db.get_readonly(prefix)
+  mem = db.get_readonly(prefix, include_vectors=False)
   return mem["id"] if mem else prefix
 
 
+def _id_error(e, args):
+  """Exit for a NotFoundError or AmbiguousPrefixError raised for args.id."""
+  from memori import AmbiguousPrefixError
+  if isinstance(e, AmbiguousPrefixError):
+    _err("ambiguous_prefix", f"{e} (use a longer prefix to disambiguate)",
+         exit_code=1, use_json=args.json, input_id=args.id)
+  _err("not_found", f"No memory matching '{args.id}' (try 'memori list' to see available memories)",
+       exit_code=1, use_json=args.json, input_id=args.id)
+
+
 # -- Commands --
 
 
@@ -186,8 +197,7 @@ def _warn_unknown_type(meta):
   if meta and isinstance(meta, dict) and "type" in meta:
     t = meta["type"]
     if isinstance(t, str) and t not in KNOWN_TYPES:
-      known = ", ".join(sorted(KNOWN_TYPES))
-      print(f"Warning: unknown type '{t}'. Known types: {known}", file=sys.stderr)
+      print(f"Warning: unknown type '{t}'. Known types: {_KNOWN_TYPES_SORTED}", file=sys.stderr)
 
 
 def cmd_store(args):
@@ -235,6 +245,7 @@ def cmd_search(args):
   results = db.search(
     vector=vector, text=args.text, filter=filt, limit=args.limit,
     text_only=text_only, before=before_ts, after=after_ts,
+    include_vectors=include_vectors,
   )
 
   if args.json:
@@ -266,10 +277,12 @@ def cmd_search(args):
 
 def cmd_get(args):
   db = _get_db(args.db)
-  mem = db.get(args.id)
+  from memori import AmbiguousPrefixError
+  try:
+    mem = db.get(args.id, include_vectors=getattr(args, "include_vectors", False))
+  except AmbiguousPrefixError as e:
+    _id_error(e, args)
   if mem:
-    if not getattr(args, "include_vectors", False):
-      mem.pop("vector", None)
     print(json.dumps(mem, indent=_json_indent(args), default=str))
   else:
     _err("not_found", f"No memory matching '{args.id}' (try 'memori list' to see available memories)",
@@ -289,13 +302,12 @@ def cmd_update(args):
   # Default is merge; --replace switches to full replacement
   merge = not getattr(args, "replace", False)
 
-  full_id = _resolve_id(db, args.id)
-
+  from memori import AmbiguousPrefixError, NotFoundError
   try:
+    full_id = _resolve_id(db, args.id)
     db.update(args.id, content=content, vector=vector, metadata=meta, merge_metadata=merge)
-  except RuntimeError:
-    _err("not_found", f"No memory matching '{args.id}' (try 'memori list' to see available memories)",
-         exit_code=1, use_json=args.json, input_id=args.id)
+  except (NotFoundError, AmbiguousPrefixError) as e:
+    _id_error(e, args)
 
   if args.json:
     print(json.dumps({"id": full_id, "status": "updated"}))
@@ -303,12 +315,14 @@ def cmd_update(args):
     print(f"Updated {full_id}")
 
 
+_TAG_BOOLS = {"true": True, "false": False}
+
+
 def _parse_tag_value(v):
   """Parse a tag value string into its natural type (bool, int, float, or str)."""
-  if v.lower() == "true":
-    return True
-  if v.lower() == "false":
-    return False
+  b = _TAG_BOOLS.get(v.lower())
+  if b is not None:
+    return b
   try:
     return int(v)
   except ValueError:
@@ -326,23 +340,23 @@ def cmd_tag(args):
   # Parse key=value pairs with type coercion
   tags = {}
   for pair in args.tags:
-    if "=" not in pair:
+    k, sep, v = pair.partition("=")
+    if not sep:
       _err("invalid_format", f"Invalid tag format (expected key=value): {pair}",
            exit_code=2, use_json=args.json)
-    k, v = pair.split("=", 1)
     tags[k] = _parse_tag_value(v)
 
-  full_id = _resolve_id(db, args.id)
-
+  from memori import AmbiguousPrefixError, NotFoundError
   try:
     # merge_metadata=True handles the read-modify-write in Rust
     db.update(args.id, metadata=tags, merge_metadata=True)
-  except RuntimeError:
-    _err("not_found", f"No memory matching '{args.id}' (try 'memori list' to see available memories)",
-         exit_code=1, use_json=args.json, input_id=args.id)
+  except (NotFoundError, AmbiguousPrefixError) as e:
+    _id_error(e, args)
 
-  # Fetch merged result for display (readonly to avoid inflating access_count)
-  mem = db.get_readonly(args.id)
+  # Fetch merged result for display (readonly to avoid inflating access_count).
+  # The same read resolves the prefix, so no separate _resolve_id() round-trip.
+  mem = db.get_readonly(args.id, include_vectors=False)
+  full_id = mem["id"] if mem else args.id
   merged = mem.get("metadata") or {} if mem else tags
 
   if args.json:
@@ -366,6 +380,7 @@ def cmd_list(args):
     offset=args.offset,
     before=before_ts,
     after=after_ts,
+    include_vectors=include_vectors,
   )
 
   if args.json:
@@ -395,7 +410,7 @@ def cmd_list(args):
         meta_type = f" [{meta['type']}]"
       access = r.get("access_count", 0)
       access_str = f" ({access} hits)" if access > 0 else ""
-      content = r["content"][:100] + ("..." if len(r["content"]) > 100 else "")
+      content = _truncate(r["content"], 100)
       print(f"{r['id'][:8]}{meta_type}{access_str} {content}")
 
 
@@ -413,15 +428,16 @@ def cmd_context(args):
     search_filter = {"project": args.project}
 
   # Relevant matches (always hybrid search -- let Rust handle efficiency)
-  matches = db.search(text=topic, filter=search_filter, limit=limit)
+  matches = db.search(text=topic, filter=search_filter, limit=limit, include_vectors=False)
   # Recent memories (by last update, not creation)
-  recent = db.list(sort="updated", limit=5)
+  recent = db.list(sort="updated", limit=5, include_vectors=False)
   # Frequently accessed (only show if any have been accessed)
-  frequent = db.list(sort="count", limit=3)
+  frequent = db.list(sort="count", limit=3, include_vectors=False)
   frequent = [r for r in frequent if r.get("access_count", 0) > 0]
   # Stale memories (created 30+ days ago, never accessed)
   thirty_days_ago = time.time() - 30 * 86400
-  stale_candidates = db.list(sort="created", limit=20, before=thirty_days_ago)
+  stale_candidates = db.list(sort="created", limit=20, before=thirty_days_ago,
+                             include_vectors=False)
   stale = [r for r in stale_candidates if r.get("access_count", 0) == 0][:5]
   # Type distribution
   type_dist = db.type_distribution()
@@ -474,46 +490,49 @@ def cmd_context(args):
     }
     print(json.dumps(out, indent=_json_indent(args), default=str))
   else:
-    # Human-readable markdown sections
-    print(f"## Relevant Memories: \"{topic}\"\n")
+    # Human-readable markdown sections, written with a single print
+    lines = []
+    emit = lines.append
+    emit(f"## Relevant Memories: \"{topic}\"\n")
     if matches:
       for r in matches:
         score = f" [{r['score']:.4f}]" if r.get("score") is not None else ""
-        content = r["content"][:120] + ("..." if len(r["content"]) > 120 else "")
-        print(f"- {r['id'][:8]}{score} {content}")
+        content = _truncate(r["content"], 120)
+        emit(f"- {r['id'][:8]}{score} {content}")
     else:
-      print("  (no matches)")
+      emit("  (no matches)")
 
-    print(f"\n## Recent Memories (by last update)\n")
+    emit(f"\n## Recent Memories (by last update)\n")
     if recent:
       for r in recent:
-        content = r["content"][:100] + ("..." if len(r["content"]) > 100 else "")
+        content = _truncate(r["content"], 100)
         meta_type = ""
         meta = r.get("metadata")
         if meta and isinstance(meta, dict) and "type" in meta:
           meta_type = f" [{meta['type']}]"
-        print(f"- {r['id'][:8]}{meta_type} {content}")
+        emit(f"- {r['id'][:8]}{meta_type} {content}")
     else:
-      print("  (empty)")
+      emit("  (empty)")
 
     if frequent:
-      print(f"\n## Frequently Accessed\n")
+      emit(f"\n## Frequently Accessed\n")
       for r in frequent:
-        content = r["content"][:100] + ("..." if len(r["content"]) > 100 else "")
+        content = _truncate(r["content"], 100)
         hits = r.get("access_count", 0)
-        print(f"- {r['id'][:8]} ({hits} hits) {content}")
+        emit(f"- {r['id'][:8]} ({hits} hits) {content}")
 
     if stale:
-      print(f"\n## Stale Memories (30+ days, never accessed)\n")
+      emit(f"\n## Stale Memories (30+ days, never accessed)\n")
       for r in stale:
-        content = r["content"][:100] + ("..." if len(r["content"]) > 100 else "")
-        print(f"- {r['id'][:8]} {content}")
+        content = _truncate(r["content"], 100)
+        emit(f"- {r['id'][:8]} {content}")
 
-    print(f"\n## Stats\n")
-    print(f"Total: {total} memories")
+    emit(f"\n## Stats\n")
+    emit(f"Total: {total} memories")
     if type_dist:
       parts = [f"{t}: {c}" for t, c in sorted(type_dist.items(), key=lambda x: -x[1])]
-      print(f"Types: {', '.join(parts)}")
+      emit(f"Types: {', '.join(parts)}")
+    print("\n".join(lines))
 
 
 def cmd_embed(args):
@@ -550,11 +569,16 @@ def cmd_export(args):
   include_vectors = args.include_vectors
   batch_size = 100
   offset = 0
+  dumps = json.dumps
+  write = sys.stdout.write
 
   while True:
-    batch = db.list(sort="created", limit=batch_size, offset=offset)
+    batch = db.list(sort="created", limit=batch_size, offset=offset,
+                    include_vectors=include_vectors)
     if not batch:
       break
+    # One write per batch instead of one print per memory
+    lines = []
     for r in batch:
       entry = {
         "id": r["id"],
@@ -566,52 +590,119 @@ def cmd_export(args):
         "access_count": r.get("access_count", 0),
         "vector": r.get("vector") if include_vectors else None,
       }
-      print(json.dumps(entry, default=str))
+      lines.append(dumps(entry, default=str))
+    lines.append("")
+    write("\n".join(lines))
     offset += len(batch)
     if len(batch) < batch_size:
       break
 
 
+def _write_import_batch(db, batch, new_ids, report):
+  """Write parsed import entries in one transaction.
+
+  Every entry already carries its vector, so the write lock is never held
+  while the embedding model runs. Each entry runs under a savepoint: a
+  failing one is undone on its own and passed to report(line, error).
+  Returns (imported, errors).
+  """
+  insert = db.insert
+  insert_with_id = db.insert_with_id
+  set_access_stats = db.set_access_stats
+  savepoint = db.savepoint
+  release_savepoint = db.release_savepoint
+  rollback_to_savepoint = db.rollback_to_savepoint
+  imported = 0
+  errors = 0
+
+  db.begin()
+  try:
+    for n, entry, vector in batch:
+      get = entry.get
+      savepoint()
+      try:
+        if new_ids:
+          mem_id = insert(entry["content"], vector=vector, metadata=get("metadata"))["id"]
+        else:
+          mem_id = insert_with_id(
+            entry["id"], entry["content"],
+            vector=vector, metadata=get("metadata"),
+            created_at=get("created_at"), updated_at=get("updated_at"),
+          )
+
+        # Restore access stats if present in export
+        last_accessed = get("last_accessed")
+        access_count = get("access_count", 0)
+        if last_accessed is not None or access_count > 0:
+          set_access_stats(mem_id, last_accessed=last_accessed, access_count=access_count)
+      except Exception as e:
+        rollback_to_savepoint()
+        errors += 1
+        report(n, e)
+        continue
+      release_savepoint()
+      imported += 1
+    db.commit()
+  except BaseException:
+    db.rollback()
+    raise
+  return imported, errors
+
+
 def cmd_import(args):
   db = _get_db(args.db)
   new_ids = args.new_ids
   imported = 0
   errors = 0
+  # Bound once: these run for every line of the import
+  loads = json.loads
+  embed = db.embed
+  batch = []
+  n = 0
 
-  for line in sys.stdin:
-    line = line.strip()
-    if not line:
-      continue
-    try:
-      entry = json.loads(line)
-      content = entry["content"]
-      metadata = entry.get("metadata")
-      vector = entry.get("vector")
-      created_at = entry.get("created_at")
-      updated_at = entry.get("updated_at")
-
-      last_accessed = entry.get("last_accessed")
-      access_count = entry.get("access_count", 0)
-
-      if new_ids:
-        result = db.insert(content, vector=vector, metadata=metadata, no_embed=False)
-        mem_id = result["id"]
-      else:
-        mem_id = db.insert_with_id(
-          entry["id"], content,
-          vector=vector, metadata=metadata,
-          created_at=created_at, updated_at=updated_at,
-        )
-
-      # Restore access stats if present in export
-      if last_accessed is not None or access_count > 0:
-        db.set_access_stats(mem_id, last_accessed=last_accessed, access_count=access_count)
+  def report(line_no, e):
+    if not args.json:
+      print(f"Error on line {line_no}: {e}", file=sys.stderr)
 
-      imported += 1
-    except Exception as e:
-      errors += 1
-      if not args.json:
-        print(f"Error on line {imported + errors}: {e}", file=sys.stderr)
+  try:
+    for line in sys.stdin:
+      # isspace() scans without copying; json.loads accepts the surrounding
+      # whitespace, so long vector-bearing lines are never strip()-copied.
+      if line.isspace():
+        continue
+      n += 1
+      try:
+        entry = loads(line)
+        content = entry["content"]
+        vector = entry.get("vector")
+        # Embed now, outside any transaction (same vector insert would compute)
+        if vector is None and embed is not None:
+          try:
+            vector = embed(content)
+          except RuntimeError:
+            embed = None  # built without embeddings: store unembedded, as before
+      except Exception as e:
+        errors += 1
+        report(n, e)
+        continue
+      batch.append((n, entry, vector))
+
+      if len(batch) >= _IMPORT_BATCH_SIZE:
+        done, failed = _write_import_batch(db, batch, new_ids, report)
+        imported, errors, batch = imported + done, errors + failed, []
+
+    if batch:
+      done, failed = _write_import_batch(db, batch, new_ids, report)
+      imported, errors, batch = imported + done, errors + failed, []
+  except KeyboardInterrupt:
+    # Committed batches stay; the batch in progress was rolled back or never written
+    print(f"\nInterrupted: imported {imported} memories ({errors} errors); "
+          f"{len(batch)} parsed entries were not written", file=sys.stderr)
+    sys.exit(130)
+  except RuntimeError as e:
+    # begin/commit failed (e.g. database locked): the current batch was rolled back
+    _err("import_failed", f"Import stopped after {imported} memories: {e}",
+         exit_code=1, use_json=args.json)
 
   if args.json:
     print(json.dumps({"imported": imported, "errors": errors}))
@@ -631,10 +722,7 @@ def cmd_purge(args):
   if args.confirm:
     # Actually delete (AND logic when both flags present, matching preview)
     if before_ts is not None and args.type:
-      to_delete = db.list(type_filter=args.type, sort="created", limit=1_000_000, before=before_ts)
-      for mem in to_delete:
-        db.delete(mem["id"])
-      total_deleted = len(to_delete)
+      total_deleted = db.delete_filtered(type_filter=args.type, before=before_ts)
     elif before_ts is not None:
       total_deleted = db.delete_before(before_ts)
     elif args.type:
@@ -653,14 +741,8 @@ def cmd_purge(args):
     else:
       print(f"Deleted {total_deleted} memories")
   else:
-    # Dry-run: preview what would be deleted (uses list, not search -- no vector overhead)
-    preview_items = db.list(
-      type_filter=args.type,
-      sort="created",
-      limit=1_000_000,
-      before=before_ts,
-    )
-    preview_count = len(preview_items)
+    # Dry-run: count in SQL and fetch only the rows we print
+    preview_count = db.count_filtered(type_filter=args.type, before=before_ts)
 
     criteria = {}
     if args.before:
@@ -672,10 +754,17 @@ def cmd_purge(args):
       print(json.dumps({"action": "preview", "count": preview_count, "criteria": criteria}))
     else:
       print(f"Would delete {preview_count} memories (dry-run)")
-      if preview_items:
+      if preview_count:
+        preview_items = db.list(
+          type_filter=args.type,
+          sort="created",
+          limit=10,
+          before=before_ts,
+          include_vectors=False,
+        )
         print("Preview (first 10):")
-        for r in preview_items[:10]:
-          content = r["content"][:80] + ("..." if len(r["content"]) > 80 else "")
+        for r in preview_items:
+          content = _truncate(r["content"], 80)
           print(f"  {r['id'][:8]} {content}")
       print("\nRe-run with --confirm to delete.")
 
@@ -684,13 +773,14 @@ def cmd_related(args):
   db = _get_db(args.db)
   include_vectors = getattr(args, "include_vectors", False)
   try:
-    results = db.related(args.id, limit=args.limit)
+    results = db.related(args.id, limit=args.limit, include_vectors=include_vectors)
   except RuntimeError as e:
+    from memori import AmbiguousPrefixError, InvalidVectorError
     err_msg = str(e)
-    if "no embedding" in err_msg:
+    if isinstance(e, InvalidVectorError):
       error_type = "no_embedding"
       hint = " (run 'memori embed' to generate embeddings)"
-    elif "ambiguous" in err_msg:
+    elif isinstance(e, AmbiguousPrefixError):
       error_type = "ambiguous_prefix"
       hint = " (use a longer prefix to disambiguate)"
     else:
@@ -720,18 +810,18 @@ def cmd_related(args):
     for r in results:
       score = f"[{r['score']:.4f}]" if r.get("score") is not None else ""
       meta = json.dumps(r.get("metadata") or {})
-      content = r["content"][:100] + ("..." if len(r["content"]) > 100 else "")
+      content = _truncate(r["content"], 100)
       print(f"{r['id'][:8]} {score} {content}  meta={meta}")
 
 
 def cmd_delete(args):
   db = _get_db(args.db)
-  full_id = _resolve_id(db, args.id)
+  from memori import AmbiguousPrefixError, NotFoundError
   try:
+    full_id = _resolve_id(db, args.id)
     db.delete(args.id)
-  except RuntimeError:
-    _err("not_found", f"No memory matching '{args.id}' (try 'memori list' to see available memories)",
-         exit_code=1, use_json=args.json, input_id=args.id)
+  except (NotFoundError, AmbiguousPrefixError) as e:
+    _id_error(e, args)
   if args.json:
     print(json.dumps({"id": full_id, "status": "deleted"}))
   else:
@@ -750,7 +840,6 @@ def cmd_count(args):
 def cmd_stats(args):
   db_path = args.db or DEFAULT_DB
   db = _get_db(db_path)
-  count = db.count()
 
   # DB file size
   try:
@@ -767,10 +856,11 @@ def cmd_stats(args):
   # Metadata type distribution via SQL (O(1) vs old O(N) Python loop)
   type_counts = db.type_distribution()
 
-  # Embedding coverage
+  # Embedding coverage; its total doubles as the memory count
   embed_stats = db.embedding_stats()
   embedded = embed_stats["embedded"]
   total = embed_stats["total"]
+  count = total
 
   if args.json:
     print(json.dumps({
@@ -902,124 +992,159 @@ def cmd_setup(args):
   print(f"Configured memori. Snippet at {snippet_target}, reference in {claude_target}")
 
 
-class DashboardHandler(BaseHTTPRequestHandler):
-  db = None
-
-  def log_message(self, format, *args):
-    pass  # silence request logs
-
-  def _json_response(self, data, status=200):
-    body = json.dumps(data, default=str).encode()
-    self.send_response(status)
-    self.send_header("Content-Type", "application/json")
-    self.send_header("Content-Length", str(len(body)))
-    self.end_headers()
-    self.wfile.write(body)
-
-  def _html_response(self, html):
-    body = html.encode()
-    self.send_response(200)
-    self.send_header("Content-Type", "text/html; charset=utf-8")
-    self.send_header("Content-Length", str(len(body)))
-    self.end_headers()
-    self.wfile.write(body)
-
-  def do_GET(self):
-    parsed = urlparse(self.path)
-    path = parsed.path
-    qs = parse_qs(parsed.query)
-
-    def qfirst(key, default=None):
-      return qs.get(key, [default])[0]
-
-    if path == "/":
-      data_dir = Path(__file__).parent / "data"
-      html = (data_dir / "dashboard.html").read_text()
-      self._html_response(html)
-
-    elif path == "/api/stats":
-      db = self.db
-      count = db.count()
-      types = db.type_distribution()
-      embed = db.embedding_stats()
-      self._json_response({
-        "count": count,
-        "types": types,
-        "embedding": embed,
-      })
-
-    elif path == "/api/memories" and not path.startswith("/api/memories/"):
-      db = self.db
-      type_filter = qfirst("type")
-      sort = qfirst("sort", "created")
-      limit = int(qfirst("limit", "20"))
-      offset = int(qfirst("offset", "0"))
-      before = float(qfirst("before")) if qfirst("before") else None
-      after = float(qfirst("after")) if qfirst("after") else None
-      results = db.list(
-        type_filter=type_filter, sort=sort,
-        limit=limit, offset=offset, before=before, after=after,
-      )
-      out = []
-      for r in results:
-        r.pop("vector", None)
-        out.append(r)
-      self._json_response(out)
-
-    elif path.startswith("/api/memories/"):
-      mem_id = path[len("/api/memories/"):]
-      if not mem_id:
-        self._json_response({"error": "missing id"}, 400)
-        return
-      mem = self.db.get_readonly(mem_id)
-      if mem:
-        mem.pop("vector", None)
-        self._json_response(mem)
-      else:
-        self._json_response({"error": "not_found"}, 404)
-
-    elif path == "/api/search":
-      db = self.db
-      text = qfirst("text")
-      filt_str = qfirst("filter")
-      filt = json.loads(filt_str) if filt_str else None
-      limit = int(qfirst("limit", "10"))
-      text_only = qfirst("text_only", "false") == "true"
-      before = float(qfirst("before")) if qfirst("before") else None
-      after = float(qfirst("after")) if qfirst("after") else None
-      results = db.search(
-        text=text, filter=filt, limit=limit,
-        text_only=text_only, before=before, after=after,
-      )
-      out = []
-      for r in results:
-        r.pop("vector", None)
-        out.append(r)
-      self._json_response(out)
-
-    elif path.startswith("/api/related/"):
-      mem_id = path[len("/api/related/"):]
-      limit = int(qfirst("limit", "5"))
+@functools.lru_cache(maxsize=1)
+def _dashboard_html():
+  """Return the bundled dashboard page as UTF-8 bytes, read once per process."""
+  return (Path(__file__).parent / "data" / "dashboard.html").read_bytes()
+
+
+@functools.lru_cache(maxsize=1)
+def _dashboard_handler():
+  """Build the dashboard request handler class.
+
+  Defined lazily so http.server and its imports (~40ms) load only for
+  `memori ui`, not on every CLI invocation.
+  """
+  from http.server import BaseHTTPRequestHandler
+  from urllib.parse import parse_qs, urlparse
+
+  from memori import (
+    AmbiguousPrefixError, InvalidQueryError, InvalidVectorError, NotFoundError,
+  )
+
+  class DashboardHandler(BaseHTTPRequestHandler):
+    db = None
+    # Fixed error payloads, encoded once rather than json.dumps'd per request
+    _MISSING_ID_BODY = b'{"error": "missing id"}'
+    _NOT_FOUND_BODY = b'{"error": "not_found"}'
+    _INTERNAL_BODY = b'{"error": "internal"}'
+
+    def log_message(self, format, *args):
+      pass  # silence request logs
+
+    def _json_response(self, data, status=200):
+      self._json_bytes(json.dumps(data, default=str).encode(), status)
+
+    def _json_bytes(self, body, status=200):
+      self.send_response(status)
+      self.send_header("Content-Type", "application/json")
+      self.send_header("Content-Length", str(len(body)))
+      self.end_headers()
+      self.wfile.write(body)
+
+    def _html_response(self, body):
+      self.send_response(200)
+      self.send_header("Content-Type", "text/html; charset=utf-8")
+      self.send_header("Content-Length", str(len(body)))
+      self.end_headers()
+      self.wfile.write(body)
+
+    def do_GET(self):
+      # Bad input is a 400: int()/float() on query params and
+      # json.JSONDecodeError from ?filter= are ValueErrors, invalid sort fields
+      # or filter keys raise InvalidQueryError, and a short id can match
+      # several memories. A missing memory or embedding (e.g.
+      # /api/related/<id>) is a 404. Any other RuntimeError (a locked database,
+      # I/O errors, corrupt rows) is a server fault: 500.
       try:
-        results = self.db.related(mem_id, limit=limit)
-        out = []
-        for r in results:
-          r.pop("vector", None)
-          out.append(r)
-        self._json_response(out)
-      except RuntimeError as e:
+        self._route()
+      except (NotFoundError, InvalidVectorError) as e:
         self._json_response({"error": str(e)}, 404)
+      except (ValueError, InvalidQueryError, AmbiguousPrefixError) as e:
+        self._json_response({"error": "bad_request", "message": str(e)}, 400)
+      except RuntimeError:
+        self._json_bytes(self._INTERNAL_BODY, 500)
+
+    def _route(self):
+      parsed = urlparse(self.path)
+      path = parsed.path
+      qs = parse_qs(parsed.query)
+
+      def qfirst(key, default=None):
+        return qs.get(key, [default])[0]
+
+      if path == "/":
+        self._html_response(_dashboard_html())
+
+      elif path == "/api/stats":
+        db = self.db
+        types = db.type_distribution()
+        embed = db.embedding_stats()
+        self._json_response({
+          "count": embed["total"],
+          "types": types,
+          "embedding": embed,
+        })
+
+      elif path == "/api/memories" and not path.startswith("/api/memories/"):
+        db = self.db
+        type_filter = qfirst("type")
+        sort = qfirst("sort", "created")
+        limit = int(qfirst("limit", "20"))
+        offset = int(qfirst("offset", "0"))
+        before_s, after_s = qfirst("before"), qfirst("after")
+        before = float(before_s) if before_s else None
+        after = float(after_s) if after_s else None
+        results = db.list(
+          type_filter=type_filter, sort=sort,
+          limit=limit, offset=offset, before=before, after=after,
+          include_vectors=False,
+        )
+        self._json_response(results)
+
+      elif path.startswith("/api/memories/"):
+        mem_id = path[len("/api/memories/"):]
+        if not mem_id:
+          self._json_bytes(self._MISSING_ID_BODY, 400)
+          return
+        mem = self.db.get_readonly(mem_id, include_vectors=False)
+        if mem:
+          self._json_response(mem)
+        else:
+          self._json_bytes(self._NOT_FOUND_BODY, 404)
+
+      elif path == "/api/search":
+        db = self.db
+        text = qfirst("text")
+        filt_str = qfirst("filter")
+        filt = json.loads(filt_str) if filt_str else None
+        limit = int(qfirst("limit", "10"))
+        text_only = qfirst("text_only", "false") == "true"
+        before_s, after_s = qfirst("before"), qfirst("after")
+        before = float(before_s) if before_s else None
+        after = float(after_s) if after_s else None
+        results = db.search(
+          text=text, filter=filt, limit=limit,
+          text_only=text_only, before=before, after=after,
+          include_vectors=False,
+        )
+        self._json_response(results)
 
-    else:
-      self.send_response(404)
-      self.end_headers()
+      elif path.startswith("/api/related/"):
+        mem_id = path[len("/api/related/"):]
+        limit = int(qfirst("limit", "5"))
+        results = self.db.related(mem_id, limit=limit, include_vectors=False)
+        self._json_response(results)
+
+      else:
+        self.send_response(404)
+        self.end_headers()
+
+  return DashboardHandler
 
 
 def cmd_ui(args):
+  import threading
+  import webbrowser
+  from http.server import ThreadingHTTPServer
+
   db = _get_db(args.db)
-  DashboardHandler.db = db
+  handler = _dashboard_handler()
+  handler.db = db
   port = args.port
-  server = HTTPServer(("127.0.0.1", port), DashboardHandler)
+  # One thread per request: PyMemori serialises DB access on its own mutex
+  # and releases the GIL, so a slow search no longer blocks page/asset loads.
+  server = ThreadingHTTPServer(("127.0.0.1", port), handler)
   url = f"http://127.0.0.1:{port}"
   print(f"Memori dashboard: {url}")
   print("Press Ctrl+C to stop")
@@ -1055,7 +1180,7 @@ def main():
            "  memori tag <id> verified=true priority=1           # enrich with typed tags\n"
            "  memori setup                                       # auto-configure Claude Code\n"
            "\nRun 'memori <command> --help' for details and examples on any command.\n"
-           "Known memory types: debugging, decision, architecture, pattern, preference, fact, roadmap, temporary",
+           f"Known memory types: {_KNOWN_TYPES_HELP}",
     formatter_class=argparse.RawDescriptionHelpFormatter,
   )
   parser.add_argument("--db", help=f"Database path (default: {DEFAULT_DB})")
@@ -1073,7 +1198,7 @@ def main():
 
   # store
   p_store = sub.add_parser("store", help="Store a memory", parents=[output_parser],
-      epilog="Examples:\n  memori store \"FTS5 hyphens crash MATCH\" --meta '{\"type\": \"debugging\"}'\n  memori store \"prefer dark mode\" --meta '{\"type\": \"preference\"}' --json\n\nKnown types: debugging, decision, architecture, pattern, preference, fact, roadmap, temporary",
+      epilog="Examples:\n  memori store \"FTS5 hyphens crash MATCH\" --meta '{\"type\": \"debugging\"}'\n  memori store \"prefer dark mode\" --meta '{\"type\": \"preference\"}' --json\n\nKnown types: " + _KNOWN_TYPES_HELP,
       formatter_class=_F)
   p_store.add_argument("content", help="Text content to store")
   p_store.add_argument("--meta", help="JSON metadata object")
@@ -1,13 +1,48 @@
 use std::sync::Mutex;
-use std::time::{SystemTime, UNIX_EPOCH};
 
-use memori_core::{InsertResult, Memori, Memory, SearchQuery, SortField};
+use memori_core::{InsertResult, Memori, MemoriError, Memory, SearchQuery, SortField};
+use pyo3::create_exception;
 use pyo3::exceptions::PyRuntimeError;
+use pyo3::intern;
 use pyo3::prelude::*;
-use pyo3::types::{PyDict, PyList};
-
-fn memori_err(e: memori_core::MemoriError) -> PyErr {
-    PyRuntimeError::new_err(e.to_string())
+use pyo3::types::{PyBool, PyDict, PyFloat, PyList, PyLong, PyString};
+
+// RuntimeError subclasses, so existing `except RuntimeError` keeps working
+// while callers can dispatch on type instead of matching message text.
+create_exception!(
+    memori,
+    NotFoundError,
+    PyRuntimeError,
+    "No memory matches the given ID or prefix."
+);
+create_exception!(
+    memori,
+    AmbiguousPrefixError,
+    PyRuntimeError,
+    "ID prefix matches more than one memory."
+);
+create_exception!(
+    memori,
+    InvalidVectorError,
+    PyRuntimeError,
+    "Missing or malformed embedding vector."
+);
+create_exception!(
+    memori,
+    InvalidQueryError,
+    PyRuntimeError,
+    "Unknown sort field or invalid filter."
+);
+
+fn memori_err(e: MemoriError) -> PyErr {
+    let msg = e.to_string();
+    match e {
+        MemoriError::NotFound(_) => NotFoundError::new_err(msg),
+        MemoriError::AmbiguousPrefix(..) => AmbiguousPrefixError::new_err(msg),
+        MemoriError::InvalidVector(_) => InvalidVectorError::new_err(msg),
+        MemoriError::InvalidFilter(_) => InvalidQueryError::new_err(msg),
+        _ => PyRuntimeError::new_err(msg),
+    }
 }
 
 fn py_value(py: Python<'_>, val: &serde_json::Value) -> PyResult<PyObject> {
@@ -47,51 +82,74 @@ fn pydict_to_value(dict: &Bound<'_, PyDict>) -> PyResult<serde_json::Value> {
 }
 
 fn pyobj_to_value(obj: &Bound<'_, PyAny>) -> PyResult<serde_json::Value> {
+    // Dispatch on the exact builtin type first: one type check per value
+    // instead of a chain of failed extracts (each of which builds a PyErr).
+    // bool is checked before int because it subclasses int.
     if obj.is_none() {
         Ok(serde_json::Value::Null)
-    } else if let Ok(b) = obj.extract::<bool>() {
-        Ok(serde_json::Value::Bool(b))
-    } else if let Ok(i) = obj.extract::<i64>() {
-        Ok(serde_json::Value::Number(i.into()))
-    } else if let Ok(f) = obj.extract::<f64>() {
-        Ok(serde_json::Number::from_f64(f)
-            .map(serde_json::Value::Number)
-            .unwrap_or(serde_json::Value::Null))
-    } else if let Ok(s) = obj.extract::<String>() {
-        Ok(serde_json::Value::String(s))
+    } else if let Ok(b) = obj.downcast_exact::<PyBool>() {
+        Ok(serde_json::Value::Bool(b.is_true()))
+    } else if let Ok(s) = obj.downcast_exact::<PyString>() {
+        Ok(serde_json::Value::String(s.to_cow()?.into_owned()))
     } else if let Ok(dict) = obj.downcast::<PyDict>() {
         pydict_to_value(dict)
     } else if let Ok(list) = obj.downcast::<PyList>() {
         let items: PyResult<Vec<_>> = list.iter().map(|item| pyobj_to_value(&item)).collect();
         Ok(serde_json::Value::Array(items?))
-    } else {
-        let s = obj.str()?.extract::<String>()?;
+    } else if obj.is_exact_instance_of::<PyLong>() || obj.is_exact_instance_of::<PyFloat>() {
+        pynumber_to_value(obj)
+    } else if let Ok(b) = obj.extract::<bool>() {
+        Ok(serde_json::Value::Bool(b))
+    } else if let Ok(s) = obj.extract::<String>() {
         Ok(serde_json::Value::String(s))
+    } else {
+        pynumber_to_value(obj).or_else(|_| {
+            let s = obj.str()?.extract::<String>()?;
+            Ok(serde_json::Value::String(s))
+        })
     }
 }
 
-fn memory_to_dict(py: Python<'_>, mem: &Memory) -> PyResult<PyObject> {
-    let dict = PyDict::new_bound(py);
-    dict.set_item("id", &mem.id)?;
-    dict.set_item("content", &mem.content)?;
-    dict.set_item("created_at", mem.created_at)?;
-    dict.set_item("updated_at", mem.updated_at)?;
-    dict.set_item("last_accessed", mem.last_accessed)?;
-    dict.set_item("access_count", mem.access_count)?;
+fn pynumber_to_value(obj: &Bound<'_, PyAny>) -> PyResult<serde_json::Value> {
+    if let Ok(i) = obj.extract::<i64>() {
+        Ok(serde_json::Value::Number(i.into()))
+    } else {
+        let f = obj.extract::<f64>()?;
+        Ok(serde_json::Number::from_f64(f)
+            .map(serde_json::Value::Number)
+            .unwrap_or(serde_json::Value::Null))
+    }
+}
 
-    match &mem.vector {
-        Some(v) => dict.set_item("vector", v.to_object(py))?,
-        None => dict.set_item("vector", py.None())?,
+/// Convert a Memory to a Python dict. With `include_vector` false the
+/// "vector" key is omitted, skipping the f32 -> list[float] conversion
+/// (384 Python floats per row) for callers that never read it.
+fn memory_to_dict(py: Python<'_>, mem: &Memory, include_vector: bool) -> PyResult<PyObject> {
+    // Keys are interned once per interpreter: this dict is built per result
+    // row, so each key is allocated (and hashed) once instead of per row.
+    let dict = PyDict::new_bound(py);
+    dict.set_item(intern!(py, "id"), &mem.id)?;
+    dict.set_item(intern!(py, "content"), &mem.content)?;
+    dict.set_item(intern!(py, "created_at"), mem.created_at)?;
+    dict.set_item(intern!(py, "updated_at"), mem.updated_at)?;
+    dict.set_item(intern!(py, "last_accessed"), mem.last_accessed)?;
+    dict.set_item(intern!(py, "access_count"), mem.access_count)?;
+
+    if include_vector {
+        match &mem.vector {
+            Some(v) => dict.set_item(intern!(py, "vector"), v.to_object(py))?,
+            None => dict.set_item(intern!(py, "vector"), py.None())?,
+        }
     }
 
     match &mem.metadata {
-        Some(v) => dict.set_item("metadata", py_value(py, v)?)?,
-        None => dict.set_item("metadata", py.None())?,
+        Some(v) => dict.set_item(intern!(py, "metadata"), py_value(py, v)?)?,
+        None => dict.set_item(intern!(py, "metadata"), py.None())?,
     }
 
     match mem.score {
-        Some(s) => dict.set_item("score", s)?,
-        None => dict.set_item("score", py.None())?,
+        Some(s) => dict.set_item(intern!(py, "score"), s)?,
+        None => dict.set_item(intern!(py, "score"), py.None())?,
     }
 
     Ok(dict.to_object(py))
@@ -149,18 +207,39 @@ impl PyMemori {
         insert_result_to_dict(py, &result)
     }
 
-    fn get(&self, py: Python<'_>, id: &str) -> PyResult<Option<PyObject>> {
-        let mem = self.inner.lock().unwrap().get(id).map_err(memori_err)?;
+    #[pyo3(signature = (id, include_vectors=true))]
+    fn get(&self, py: Python<'_>, id: &str, include_vectors: bool) -> PyResult<Option<PyObject>> {
+        let id_owned = id.to_string();
+        let mem = py.allow_threads(|| {
+            self.inner
+                .lock()
+                .unwrap()
+                .get(&id_owned)
+                .map_err(memori_err)
+        })?;
         match mem {
-            Some(m) => Ok(Some(memory_to_dict(py, &m)?)),
+            Some(m) => Ok(Some(memory_to_dict(py, &m, include_vectors)?)),
             None => Ok(None),
         }
     }
 
-    fn get_readonly(&self, py: Python<'_>, id: &str) -> PyResult<Option<PyObject>> {
-        let mem = self.inner.lock().unwrap().get_readonly(id).map_err(memori_err)?;
+    #[pyo3(signature = (id, include_vectors=true))]
+    fn get_readonly(
+        &self,
+        py: Python<'_>,
+        id: &str,
+        include_vectors: bool,
+    ) -> PyResult<Option<PyObject>> {
+        let id_owned = id.to_string();
+        let mem = py.allow_threads(|| {
+            self.inner
+                .lock()
+                .unwrap()
+                .get_readonly(&id_owned)
+                .map_err(memori_err)
+        })?;
         match mem {
-            Some(m) => Ok(Some(memory_to_dict(py, &m)?)),
+            Some(m) => Ok(Some(memory_to_dict(py, &m, include_vectors)?)),
             None => Ok(None),
         }
     }
@@ -168,6 +247,7 @@ impl PyMemori {
     #[pyo3(signature = (id, content=None, vector=None, metadata=None, merge_metadata=true))]
     fn update(
         &self,
+        py: Python<'_>,
         id: &str,
         content: Option<&str>,
         vector: Option<Vec<f32>>,
@@ -175,18 +255,35 @@ impl PyMemori {
         merge_metadata: bool,
     ) -> PyResult<()> {
         let meta = metadata.map(pydict_to_value).transpose()?;
-        self.inner
-            .lock()
-            .unwrap()
-            .update(id, content, vector.as_deref(), meta, merge_metadata)
-            .map_err(memori_err)
+        let id_owned = id.to_string();
+        let content_owned = content.map(|c| c.to_string());
+        py.allow_threads(|| {
+            self.inner
+                .lock()
+                .unwrap()
+                .update(
+                    &id_owned,
+                    content_owned.as_deref(),
+                    vector.as_deref(),
+                    meta,
+                    merge_metadata,
+                )
+                .map_err(memori_err)
+        })
     }
 
-    fn delete(&self, id: &str) -> PyResult<()> {
-        self.inner.lock().unwrap().delete(id).map_err(memori_err)
+    fn delete(&self, py: Python<'_>, id: &str) -> PyResult<()> {
+        let id_owned = id.to_string();
+        py.allow_threads(|| {
+            self.inner
+                .lock()
+                .unwrap()
+                .delete(&id_owned)
+                .map_err(memori_err)
+        })
     }
 
-    #[pyo3(signature = (vector=None, text=None, filter=None, limit=10, text_only=false, before=None, after=None))]
+    #[pyo3(signature = (vector=None, text=None, filter=None, limit=10, text_only=false, before=None, after=None, include_vectors=true))]
     fn search(
         &self,
         py: Python<'_>,
@@ -197,6 +294,7 @@ impl PyMemori {
         text_only: bool,
         before: Option<f64>,
         after: Option<f64>,
+        include_vectors: bool,
     ) -> PyResult<Vec<PyObject>> {
         let filter_val = filter.map(pydict_to_value).transpose()?;
         let query = SearchQuery {
@@ -213,10 +311,13 @@ impl PyMemori {
             self.inner.lock().unwrap().search(query).map_err(memori_err)
         })?;
 
-        results.iter().map(|m| memory_to_dict(py, m)).collect()
+        results
+            .iter()
+            .map(|m| memory_to_dict(py, m, include_vectors))
+            .collect()
     }
 
-    #[pyo3(signature = (type_filter=None, sort="created", limit=20, offset=0, before=None, after=None))]
+    #[pyo3(signature = (type_filter=None, sort="created", limit=20, offset=0, before=None, after=None, include_vectors=true))]
     fn list(
         &self,
         py: Python<'_>,
@@ -226,25 +327,56 @@ impl PyMemori {
         offset: usize,
         before: Option<f64>,
         after: Option<f64>,
+        include_vectors: bool,
     ) -> PyResult<Vec<PyObject>> {
-        let sort_field = SortField::from_str(sort)
-            .map_err(|e| PyRuntimeError::new_err(e))?;
-        let results = self
-            .inner
-            .lock()
-            .unwrap()
-            .list(type_filter, &sort_field, limit, offset, before, after)
-            .map_err(memori_err)?;
-        results.iter().map(|m| memory_to_dict(py, m)).collect()
+        let sort_field = SortField::from_str(sort).map_err(InvalidQueryError::new_err)?;
+        let type_owned = type_filter.map(|t| t.to_string());
+        let results = py.allow_threads(|| {
+            self.inner
+                .lock()
+                .unwrap()
+                .list(
+                    type_owned.as_deref(),
+                    &sort_field,
+                    limit,
+                    offset,
+                    before,
+                    after,
+                )
+                .map_err(memori_err)
+        })?;
+        results
+            .iter()
+            .map(|m| memory_to_dict(py, m, include_vectors))
+            .collect()
+    }
+
+    fn count(&self, py: Python<'_>) -> PyResult<usize> {
+        py.allow_threads(|| self.inner.lock().unwrap().count().map_err(memori_err))
     }
 
-    fn count(&self) -> PyResult<usize> {
-        self.inner.lock().unwrap().count().map_err(memori_err)
+    #[pyo3(signature = (type_filter=None, before=None, after=None))]
+    fn count_filtered(
+        &self,
+        py: Python<'_>,
+        type_filter: Option<&str>,
+        before: Option<f64>,
+        after: Option<f64>,
+    ) -> PyResult<usize> {
+        let type_owned = type_filter.map(|t| t.to_string());
+        py.allow_threads(|| {
+            self.inner
+                .lock()
+                .unwrap()
+                .count_filtered(type_owned.as_deref(), before, after)
+                .map_err(memori_err)
+        })
     }
 
     #[pyo3(signature = (id, content, vector=None, metadata=None, created_at=None, updated_at=None))]
     fn insert_with_id(
         &self,
+        py: Python<'_>,
         id: &str,
         content: &str,
         vector: Option<Vec<f32>>,
@@ -253,44 +385,92 @@ impl PyMemori {
         updated_at: Option<f64>,
     ) -> PyResult<String> {
         let meta = metadata.map(pydict_to_value).transpose()?;
-        let now = SystemTime::now()
-            .duration_since(UNIX_EPOCH)
-            .unwrap()
-            .as_secs_f64();
-        let ca = created_at.unwrap_or(now);
-        let ua = updated_at.unwrap_or(now);
-        self.inner
-            .lock()
-            .unwrap()
-            .insert_with_id(id, content, vector.as_deref(), meta, ca, ua)
-            .map_err(memori_err)
+        // Import passes both timestamps; only read the clock when one is missing.
+        let (ca, ua) = match (created_at, updated_at) {
+            (Some(ca), Some(ua)) => (ca, ua),
+            _ => {
+                let now = memori_core::util::now_secs();
+                (created_at.unwrap_or(now), updated_at.unwrap_or(now))
+            }
+        };
+        let id_owned = id.to_string();
+        let content_owned = content.to_string();
+        py.allow_threads(|| {
+            self.inner
+                .lock()
+                .unwrap()
+                .insert_with_id(&id_owned, &content_owned, vector.as_deref(), meta, ca, ua)
+                .map_err(memori_err)
+        })
+    }
+
+    fn begin(&self, py: Python<'_>) -> PyResult<()> {
+        // BEGIN IMMEDIATE may wait on another writer's lock
+        py.allow_threads(|| self.inner.lock().unwrap().begin().map_err(memori_err))
+    }
+
+    fn commit(&self, py: Python<'_>) -> PyResult<()> {
+        py.allow_threads(|| self.inner.lock().unwrap().commit().map_err(memori_err))
+    }
+
+    fn rollback(&self, py: Python<'_>) -> PyResult<()> {
+        py.allow_threads(|| self.inner.lock().unwrap().rollback().map_err(memori_err))
+    }
+
+    fn savepoint(&self, py: Python<'_>) -> PyResult<()> {
+        py.allow_threads(|| self.inner.lock().unwrap().savepoint().map_err(memori_err))
+    }
+
+    fn release_savepoint(&self, py: Python<'_>) -> PyResult<()> {
+        py.allow_threads(|| {
+            self.inner
+                .lock()
+                .unwrap()
+                .release_savepoint()
+                .map_err(memori_err)
+        })
+    }
+
+    fn rollback_to_savepoint(&self, py: Python<'_>) -> PyResult<()> {
+        py.allow_threads(|| {
+            self.inner
+                .lock()
+                .unwrap()
+                .rollback_to_savepoint()
+                .map_err(memori_err)
+        })
     }
 
-    fn vacuum(&self) -> PyResult<()> {
-        self.inner.lock().unwrap().vacuum().map_err(memori_err)
+    fn vacuum(&self, py: Python<'_>) -> PyResult<()> {
+        py.allow_threads(|| self.inner.lock().unwrap().vacuum().map_err(memori_err))
     }
 
     #[pyo3(signature = (id, last_accessed=None, access_count=0))]
     fn set_access_stats(
         &self,
+        py: Python<'_>,
         id: &str,
         last_accessed: Option<f64>,
         access_count: i64,
     ) -> PyResult<()> {
-        self.inner
-            .lock()
-            .unwrap()
-            .set_access_stats(id, last_accessed, access_count)
-            .map_err(memori_err)
+        let id_owned = id.to_string();
+        py.allow_threads(|| {
+            self.inner
+                .lock()
+                .unwrap()
+                .set_access_stats(&id_owned, last_accessed, access_count)
+                .map_err(memori_err)
+        })
     }
 
     fn type_distribution(&self, py: Python<'_>) -> PyResult<PyObject> {
-        let dist = self
-            .inner
-            .lock()
-            .unwrap()
-            .type_distribution()
-            .map_err(memori_err)?;
+        let dist = py.allow_threads(|| {
+            self.inner
+                .lock()
+                .unwrap()
+                .type_distribution()
+                .map_err(memori_err)
+        })?;
         let dict = PyDict::new_bound(py);
         for (k, v) in dist {
             dict.set_item(k, v)?;
@@ -298,31 +478,55 @@ impl PyMemori {
         Ok(dict.to_object(py))
     }
 
-    fn delete_before(&self, before_timestamp: f64) -> PyResult<usize> {
-        self.inner
-            .lock()
-            .unwrap()
-            .delete_before(before_timestamp)
-            .map_err(memori_err)
+    fn delete_before(&self, py: Python<'_>, before_timestamp: f64) -> PyResult<usize> {
+        py.allow_threads(|| {
+            self.inner
+                .lock()
+                .unwrap()
+                .delete_before(before_timestamp)
+                .map_err(memori_err)
+        })
+    }
+
+    fn delete_by_type(&self, py: Python<'_>, type_value: &str) -> PyResult<usize> {
+        let type_owned = type_value.to_string();
+        py.allow_threads(|| {
+            self.inner
+                .lock()
+                .unwrap()
+                .delete_by_type(&type_owned)
+                .map_err(memori_err)
+        })
     }
 
-    fn delete_by_type(&self, type_value: &str) -> PyResult<usize> {
-        self.inner
-            .lock()
-            .unwrap()
-            .delete_by_type(type_value)
-            .map_err(memori_err)
+    #[pyo3(signature = (type_filter=None, before=None, after=None))]
+    fn delete_filtered(
+        &self,
+        py: Python<'_>,
+        type_filter: Option<&str>,
+        before: Option<f64>,
+        after: Option<f64>,
+    ) -> PyResult<usize> {
+        let type_owned = type_filter.map(|t| t.to_string());
+        py.allow_threads(|| {
+            self.inner
+                .lock()
+                .unwrap()
+                .delete_filtered(type_owned.as_deref(), before, after)
+                .map_err(memori_err)
+        })
     }
 
     #[pyo3(signature = (text,))]
-    fn embed(&self, text: &str) -> PyResult<Vec<f32>> {
+    fn embed(&self, py: Python<'_>, text: &str) -> PyResult<Vec<f32>> {
         #[cfg(feature = "embeddings")]
         {
-            Ok(memori_core::embed::embed_text(text))
+            let text_owned = text.to_string();
+            Ok(py.allow_threads(|| memori_core::embed::embed_text(&text_owned)))
         }
         #[cfg(not(feature = "embeddings"))]
         {
-            let _ = text;
+            let _ = (py, text);
             Err(PyRuntimeError::new_err(
                 "embeddings feature not enabled at compile time",
             ))
@@ -340,8 +544,14 @@ impl PyMemori {
         })
     }
 
-    #[pyo3(signature = (id, limit=5))]
-    fn related(&self, py: Python<'_>, id: &str, limit: usize) -> PyResult<Vec<PyObject>> {
+    #[pyo3(signature = (id, limit=5, include_vectors=true))]
+    fn related(
+        &self,
+        py: Python<'_>,
+        id: &str,
+        limit: usize,
+        include_vectors: bool,
+    ) -> PyResult<Vec<PyObject>> {
         let id_owned = id.to_string();
         let results = py.allow_threads(|| {
             self.inner
@@ -350,16 +560,20 @@ impl PyMemori {
                 .related(&id_owned, limit)
                 .map_err(memori_err)
         })?;
-        results.iter().map(|m| memory_to_dict(py, m)).collect()
+        results
+            .iter()
+            .map(|m| memory_to_dict(py, m, include_vectors))
+            .collect()
     }
 
     fn embedding_stats(&self, py: Python<'_>) -> PyResult<PyObject> {
-        let (embedded, total) = self
-            .inner
-            .lock()
-            .unwrap()
-            .embedding_stats()
-            .map_err(memori_err)?;
+        let (embedded, total) = py.allow_threads(|| {
+            self.inner
+                .lock()
+                .unwrap()
+                .embedding_stats()
+                .map_err(memori_err)
+        })?;
         let dict = PyDict::new_bound(py);
         dict.set_item("embedded", embedded)?;
         dict.set_item("total", total)?;
@@ -370,5 +584,18 @@ impl PyMemori {
 #[pymodule]
 fn memori(m: &Bound<'_, PyModule>) -> PyResult<()> {
     m.add_class::<PyMemori>()?;
+    m.add("NotFoundError", m.py().get_type_bound::<NotFoundError>())?;
+    m.add(
+        "AmbiguousPrefixError",
+        m.py().get_type_bound::<AmbiguousPrefixError>(),
+    )?;
+    m.add(
+        "InvalidVectorError",
+        m.py().get_type_bound::<InvalidVectorError>(),
+    )?;
+    m.add(
+        "InvalidQueryError",
+        m.py().get_type_bound::<InvalidQueryError>(),
+    )?;
     Ok(())
 }
@@ -72,6 +72,24 @@ def get_memory_json(db_path, mem_id):
     return json.loads(result.stdout)
 
 
+def store_prefix_pair(db_path):
+    """Import two memories whose ids share the prefix "abcd"; return the ids."""
+    ids = ["abcd1111-0000-0000-0000-000000000001", "abcd2222-0000-0000-0000-000000000002"]
+    lines = "".join(json.dumps({"id": i, "content": f"pair {n}"}) + "\n" for n, i in enumerate(ids))
+    result = run_memori("--json", "import", db_path=db_path, stdin=lines)
+    assert result.returncode == 0, f"import failed: {result.stderr}"
+    return ids
+
+
+def assert_ambiguous(result):
+    """The command failed on an ambiguous prefix, reporting how many ids matched."""
+    assert result.returncode == 1
+    err = json.loads(result.stderr)
+    assert err["error"] == "ambiguous_prefix"
+    assert "matches 2" in err["message"]
+    assert err["id"] == "abcd"
+
+
 @pytest.fixture
 def db(tmp_path):
     """Return a path to a fresh temp database."""
@@ -331,6 +349,10 @@ class TestGet:
         err = json.loads(r.stderr)
         assert err["error"] == "not_found"
 
+    def test_get_ambiguous_prefix(self, db):
+        store_prefix_pair(db)
+        assert_ambiguous(run_memori("--json", "get", "abcd", db_path=db))
+
     def test_get_include_vectors(self, db):
         stored = store_memory(db, "with vec", extra_args=["--vector", "[1.0, 2.0, 3.0]"])
         r = run_memori("get", stored["id"], "--include-vectors", db_path=db)
@@ -393,6 +415,13 @@ class TestUpdate:
         )
         assert r.returncode == 1
 
+    def test_update_ambiguous_prefix(self, db):
+        ids = store_prefix_pair(db)
+        r = run_memori("--json", "update", "abcd", "--content", "changed", db_path=db)
+        assert_ambiguous(r)
+        assert get_memory_json(db, ids[0])["content"] == "pair 0"
+        assert get_memory_json(db, ids[1])["content"] == "pair 1"
+
     def test_update_no_args_error(self, db):
         stored = store_memory(db, "nothing to update", no_embed=True)
         r = run_memori(
@@ -468,6 +497,11 @@ class TestTag:
         r = run_memori("--json", "tag", "nonexistent-id", "key=val", db_path=db)
         assert r.returncode == 1
 
+    def test_tag_ambiguous_prefix(self, db):
+        ids = store_prefix_pair(db)
+        assert_ambiguous(run_memori("--json", "tag", "abcd", "key=val", db_path=db))
+        assert not get_memory_json(db, ids[0]).get("metadata")
+
     def test_tag_bad_format(self, db):
         stored = store_memory(db, "bad tag", no_embed=True)
         r = run_memori("--json", "tag", stored["id"], "noequals", db_path=db)
@@ -590,6 +624,13 @@ class TestList:
         assert r.returncode == 0
         assert "No memories found" in r.stdout
 
+    def test_truncate_helper(self):
+        """Listing output cuts content at n characters and marks the cut."""
+        from memori_cli import _truncate
+        assert _truncate("short", 10) == "short"
+        assert _truncate("exactly10!", 10) == "exactly10!"
+        assert _truncate("a" * 12, 10) == "a" * 10 + "..."
+
 
 # ---------------------------------------------------------------------------
 # DELETE
@@ -617,6 +658,12 @@ class TestDelete:
         assert r.returncode == 1
         assert "No memory matching" in r.stderr
 
+    def test_delete_ambiguous_prefix(self, db):
+        store_prefix_pair(db)
+        assert_ambiguous(run_memori("--json", "delete", "abcd", db_path=db))
+        r = run_memori("--json", "count", db_path=db)
+        assert json.loads(r.stdout)["count"] == 2
+
 
 # ---------------------------------------------------------------------------
 # COUNT
@@ -882,6 +929,42 @@ class TestImport:
         assert out["imported"] == 1
         assert out["errors"] == 1
 
+    def test_import_batch_boundary_and_mid_import_failure(self, db, monkeypatch, capsys):
+        # In-process so the batch size can shrink: with 2 per transaction the
+        # duplicate id fails inside the second batch, after the first committed.
+        import io
+        import memori_cli
+        from memori import PyMemori
+
+        monkeypatch.setattr(memori_cli, "_IMPORT_BATCH_SIZE", 2)
+        ids = [f"bbbb0000-0000-0000-0000-00000000000{i}" for i in range(4)]
+        entries = [
+            {"id": ids[0], "content": "first", "vector": [1.0, 0.0], "access_count": 3},
+            {"id": ids[1], "content": "second", "vector": [0.0, 1.0]},
+            "not json at all",
+            {"id": ids[0], "content": "duplicate id", "vector": [1.0, 0.0]},
+            {"id": ids[2], "content": "third", "vector": [1.0, 1.0]},
+            {"id": ids[3], "content": "fourth", "vector": [0.5, 0.5]},
+        ]
+        stdin = "\n".join(e if isinstance(e, str) else json.dumps(e) for e in entries) + "\n"
+        monkeypatch.setattr(sys, "stdin", io.StringIO(stdin))
+        monkeypatch.setattr(sys, "argv", ["memori", "--db", db, "import"])
+        memori_cli.main()
+
+        captured = capsys.readouterr()
+        assert "Imported 4 memories (2 errors)" in captured.out
+        assert "Error on line 3:" in captured.err
+        assert "Error on line 4:" in captured.err
+
+        pydb = PyMemori(db)
+        assert pydb.count() == 4
+        first = pydb.get_readonly(ids[0], include_vectors=False)
+        assert first["content"] == "first"
+        assert first["access_count"] == 3
+        # Nothing left open: another write goes straight through
+        pydb.insert("after import", no_embed=True)
+        assert pydb.count() == 5
+
 
 # ---------------------------------------------------------------------------
 # PURGE
@@ -1209,3 +1292,55 @@ class TestGlobalFlags:
         assert r.returncode == 0
         out = json.loads(r.stdout)
         assert out["count"] == 1
+
+
+# ---------------------------------------------------------------------------
+# UI (dashboard API)
+# ---------------------------------------------------------------------------
+
+
+class TestDashboard:
+    @staticmethod
+    def _get(handler, path):
+        """Serve one request on an ephemeral port; return (status, json body)."""
+        import threading
+        import urllib.error
+        import urllib.request
+        from http.server import HTTPServer
+
+        server = HTTPServer(("127.0.0.1", 0), handler)
+        thread = threading.Thread(target=server.handle_request)
+        thread.start()
+        url = f"http://127.0.0.1:{server.server_port}{path}"
+        try:
+            with urllib.request.urlopen(url) as resp:
+                status, body = resp.status, resp.read()
+        except urllib.error.HTTPError as e:
+            status, body = e.code, e.read()
+        thread.join()
+        server.server_close()
+        return status, json.loads(body)
+
+    def test_api_error_statuses(self, db):
+        """Bad input is 400, a missing memory 404, any other failure 500."""
+        from memori import PyMemori
+        from memori_cli import _dashboard_handler
+
+        handler = _dashboard_handler()
+        handler.db = PyMemori(db)
+        status, body = self._get(handler, "/api/memories?sort=nope")
+        assert status == 400
+        assert "invalid sort field" in body["message"]
+        status, _ = self._get(handler, "/api/memories?limit=abc")
+        assert status == 400
+        status, _ = self._get(handler, "/api/related/ffffffff")
+        assert status == 404
+
+        class LockedDb:
+            def type_distribution(self):
+                raise RuntimeError("database is locked")
+
+        handler.db = LockedDb()
+        status, body = self._get(handler, "/api/stats")
+        assert status == 500
+        assert body == {"error": "internal"}
@@ -167,6 +167,20 @@ def test_nested_metadata(db):
     assert mem["metadata"]["nested"]["key"] == "value"
 
 
+def test_metadata_scalar_types_roundtrip(db):
+    meta = {"flag": True, "off": False, "n": 3, "big": 2**70, "f": 1.5,
+            "s": "x", "none": None, "mixed": [1, "two", 3.0, False]}
+    mid = db.insert("scalar metadata test", metadata=meta)["id"]
+
+    got = db.get(mid)["metadata"]
+    assert got["flag"] is True and got["off"] is False
+    assert got["n"] == 3 and isinstance(got["n"], int)
+    assert got["big"] == float(2**70)
+    assert got["f"] == 1.5
+    assert got["s"] == "x" and got["none"] is None
+    assert got["mixed"] == [1, "two", 3.0, False]
+
+
 # -- v0.3 dedup tests --
 
 
@@ -274,6 +288,16 @@ def test_list_basic(db):
     assert ids1.isdisjoint(ids2)
 
 
+def test_include_vectors_false_omits_vector(db):
+    mid = db.insert("with vector", vector=[1.0, 2.0, 3.0])["id"]
+
+    assert "vector" not in db.list(limit=10, include_vectors=False)[0]
+    assert "vector" not in db.get_readonly(mid, include_vectors=False)
+    assert "vector" not in db.search(vector=[1.0, 2.0, 3.0], include_vectors=False)[0]
+    # Default keeps the vector for backwards compatibility
+    assert db.get_readonly(mid)["vector"] is not None
+
+
 def test_list_sort(db):
     r1 = db.insert("rarely accessed")
     r2 = db.insert("frequently accessed")
@@ -371,6 +395,29 @@ def test_related_no_vector(db):
         db.related(r["id"], limit=5)
 
 
+def test_typed_errors(db):
+    from memori import AmbiguousPrefixError, InvalidVectorError, NotFoundError
+    r = db.insert("no vector", no_embed=True)
+    with pytest.raises(InvalidVectorError):
+        db.related(r["id"], limit=5)
+    with pytest.raises(NotFoundError):
+        db.delete("ffffffff")
+    db.insert_with_id("abc-1", "one")
+    db.insert_with_id("abc-2", "two")
+    with pytest.raises(AmbiguousPrefixError):
+        db.delete("abc")
+    assert issubclass(NotFoundError, RuntimeError)
+
+
+def test_invalid_query_error(db):
+    from memori import InvalidQueryError
+    with pytest.raises(InvalidQueryError, match="invalid sort field"):
+        db.list(sort="nope")
+    with pytest.raises(InvalidQueryError, match="invalid filter key"):
+        db.search(text="x", filter={"bad key": 1})
+    assert issubclass(InvalidQueryError, RuntimeError)
+
+
 # -- v0.5 tests: list date filters --
 
 
@@ -396,6 +443,37 @@ def test_list_after(db):
     assert results[0]["content"] == "recent memory"
 
 
+def test_count_filtered(db):
+    import time
+    ts = time.time()
+    db.insert_with_id("old-1", "old fact", metadata={"type": "fact"},
+                      created_at=ts - 7200, updated_at=ts - 7200)
+    db.insert("new fact", metadata={"type": "fact"})
+    db.insert("new pref", metadata={"type": "preference"})
+
+    assert db.count_filtered() == 3
+    assert db.count_filtered(type_filter="fact") == 2
+    assert db.count_filtered(type_filter="fact", before=ts - 3600) == 1
+    assert db.count_filtered(after=ts - 3600) == 2
+
+
+def test_begin_rollback_commit(db):
+    db.begin()
+    db.insert("discarded")
+    db.rollback()
+    assert db.count() == 0
+
+    db.begin()
+    mid = db.insert_with_id("kept-1", "kept", created_at=1.0, updated_at=1.0)
+    db.set_access_stats(mid, last_accessed=2.0, access_count=4)
+    db.commit()
+    assert db.get_readonly(mid)["access_count"] == 4
+
+    # No transaction open: both are safe no-ops
+    db.commit()
+    db.rollback()
+
+
 # -- v0.5.1 tests: CLI prefix resolution in mutation output --
 
 